@@ -11,14 +11,135 @@ Features:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+import lxml.html
+from lxml import etree
+from datetime import date, datetime, time, timedelta, timezone
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 import vertexai
 from vertexai.generative_models import GenerativeModel, GenerationConfig
 import json
+import orjson
 import re
 import math
+import copy
+import hashlib
+import threading
+import time as time_module
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Crawl limits
+# MAX_PAGES keeps the prompt sent to Gemini a reasonable size
+# MAX_FETCH_WORKERS is how many pages we download at the same time
+MAX_PAGES = 10
+MAX_FETCH_WORKERS = 10
+
+# Keywords that suggest relevant links
+# Compiled into one regex so each link is scanned once for all keywords
+# instead of once per keyword
+RELEVANT_KEYWORDS = [
+    'session', 'schedule', 'registration', 'sign up', 'signup',
+    'enroll', 'camp', 'program', 'pricing', 'cost', 'dates',
+    'summer', 'week', 'age', 'grade'
+]
+RELEVANT_KEYWORD_PATTERN = re.compile('|'.join(re.escape(k) for k in RELEVANT_KEYWORDS))
+
+# An XML declaration like <?xml version="1.0" encoding="utf-8"?> at the top
+# of a page (common on XHTML sites). lxml refuses to parse an already-decoded
+# string that declares an encoding, so identify_relevant_links removes it
+XML_DECLARATION_PATTERN = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# datetime.weekday() value for Monday (Monday=0 ... Sunday=6)
+MONDAY = 0
+
+# Closing tags that make a clean place to cut HTML that's too long
+# See truncate_html
+TRUNCATE_AT_TAGS = ['</tr>', '</li>', '</p>', '</table>']
+
+# Shared HTTP session for crawling
+# Reusing one session keeps connections to the camp website open between
+# requests, so we don't redo the TCP/TLS handshake for every page.
+# The pool is sized so each fetch worker can hold its own connection.
+USER_AGENT = 'Mozilla/5.0 (compatible; SummerCampBot/1.0)'
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers['User-Agent'] = USER_AGENT
+_http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+HTTP_SESSION.mount('http://', _http_adapter)
+HTTP_SESSION.mount('https://', _http_adapter)
+
+# Crawling politeness
+# Requests to the same host are spaced at least this far apart, and each
+# host's robots.txt is read and obeyed. See wait_for_host_turn and
+# is_allowed_by_robots.
+POLITENESS_DELAY_SECONDS = 0.5
+_next_fetch_time_by_host = {}
+# Instances stay alive for days, so re-read each robots.txt after this long
+ROBOTS_CACHE_TTL = timedelta(hours=1)
+_robots_parsers = {}
+_politeness_lock = threading.Lock()
+
+# In-memory cache of fetched pages, keyed on URL
+# See fetch_page
+PAGE_CACHE_TTL = timedelta(hours=1)
+PAGE_CACHE_MAX_ENTRIES = 256
+_page_cache = OrderedDict()
+_page_cache_lock = threading.Lock()
+
+# Vertex AI setup is done once and reused across requests
+# See init_vertex_ai and get_model
+_vertex_ai_initialized = set()
+_models = {}
+
+# Patterns used to clean up Gemini's JSON responses
+# Compiled once here rather than on every call
+# MARKDOWN_FENCE_PATTERN removes the opening ```json fence (and anything
+# before it) and the closing ``` fence (and anything after it)
+MARKDOWN_FENCE_PATTERN = re.compile(r'^.*?```json?\s*|\s*```.*$', re.DOTALL)
+TRAILING_COMMA_PATTERN = re.compile(r',(\s*[}\]])')
+MISSING_COMMA_PATTERN = re.compile(r'(\}|\])\s*\n\s*"')
+
+# Settings for every Gemini extraction request
+GENERATION_CONFIG = GenerationConfig(
+    temperature=0.1,  # Low temperature for more consistent output
+    max_output_tokens=8192,
+)
+
+# In-memory cache of Gemini results, keyed on a hash of the page content
+# Re-parsing the same camp page is common (e.g. retrying the form), and a
+# Gemini call takes several seconds, so reuse recent results for a day
+RESPONSE_CACHE_TTL = timedelta(hours=24)
+RESPONSE_CACHE_MAX_ENTRIES = 100
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def parse_date(date_str):
+    """
+    Parse a 'YYYY-MM-DD' date string into a datetime (at midnight).
+
+    Args:
+        date_str: Date string, e.g. '2026-06-08'
+
+    Returns:
+        datetime for the start of that day
+
+    Raises:
+        ValueError: If the string isn't a valid date
+
+    Why: fromisoformat is implemented in C and is much faster than
+    strptime, which re-interprets the format string on every call. We fall
+    back to strptime for dates without zero padding (e.g. '2026-6-8'),
+    which fromisoformat rejects but strptime accepts.
+    """
+    try:
+        # date.fromisoformat (unlike datetime.fromisoformat) rejects times
+        # and time zones, so results always compare cleanly with naive dates
+        return datetime.combine(date.fromisoformat(date_str), time())
+    except ValueError:
+        return datetime.strptime(date_str, '%Y-%m-%d')
 
 
 def calculate_session_durations(extracted_data):
@@ -47,8 +168,8 @@ def calculate_session_durations(extracted_data):
             continue
 
         try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
+            start_date = parse_date(start_date_str)
+            end_date = parse_date(end_date_str)
 
             # Calculate total days (inclusive)
             total_days = (end_date - start_date).days + 1
@@ -87,6 +208,60 @@ def calculate_session_durations(extracted_data):
                 session['duration_weeks'] = 1
 
 
+def response_cache_key(html, original_url, model_name):
+    """
+    Build the response cache key for a Gemini request.
+
+    Why: The URL and model are part of the key because both change what
+    Gemini returns, even for identical page content.
+    """
+    digest = hashlib.sha256()
+    for part in (model_name, original_url, html):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def get_cached_response(cache_key):
+    """
+    Look up a previous Gemini result in the response cache.
+
+    Returns:
+        dict: A copy of the cached data, or None on a miss or expired entry
+    """
+    # Parse jobs run on several threads, so only one touches the cache at a time
+    with _response_cache_lock:
+        cached = _response_cache.get(cache_key)
+        if not cached:
+            return None
+
+        if cached['expires_at'] <= datetime.now(timezone.utc):
+            _response_cache.pop(cache_key, None)
+            return None
+
+        # Mark as recently used so it's the last to be evicted
+        _response_cache.move_to_end(cache_key)
+
+    # Return a copy because callers modify the data (e.g. duration_weeks)
+    return copy.deepcopy(cached['data'])
+
+
+def cache_response(cache_key, data):
+    """
+    Store a Gemini result in the response cache, evicting the oldest entry
+    once the cache is full.
+    """
+    entry = {
+        'data': copy.deepcopy(data),
+        'expires_at': datetime.now(timezone.utc) + RESPONSE_CACHE_TTL
+    }
+    with _response_cache_lock:
+        _response_cache[cache_key] = entry
+        _response_cache.move_to_end(cache_key)
+        while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+
 def parse_session_url(url, project_id, region, model_name):
     """
     Main entry point for parsing a camp session URL.
@@ -110,31 +285,43 @@ def parse_session_url(url, project_id, region, model_name):
 
         # Prioritize the main page (depth 0) - send up to 300K of it
         # Then add additional pages if there's room (max 400K total for faster processing)
+        # Scripts and styles are stripped first so the size budget is spent
+        # on actual page content instead of JavaScript
         main_page = next((p for p in pages if p['depth'] == 0), None)
         if main_page:
             # Take more content from the main page
-            combined_html = main_page['html'][:300000]
+            combined_html = truncate_html(clean_html_for_ai(main_page['html']), 300000)
             print(f"Using main page HTML (up to 300K): {len(combined_html)} characters")
 
             # Add other pages if we have room
             for page in pages:
                 if page['depth'] > 0 and len(combined_html) < 400000:
                     remaining_space = 400000 - len(combined_html)
-                    combined_html += "\n\n" + page['html'][:remaining_space]
+                    combined_html += "\n\n" + truncate_html(clean_html_for_ai(page['html']), remaining_space)
         else:
             # Fallback to combining all pages
-            combined_html = "\n\n".join([p['html'] for p in pages])[:400000]
+            combined_html = truncate_html(
+                "\n\n".join([clean_html_for_ai(p['html']) for p in pages]),
+                400000
+            )
 
         print(f"Final combined HTML length: {len(combined_html)} characters")
 
-        # Call Gemini to extract structured data
-        extracted_data = call_gemini_api(
-            combined_html,
-            url,
-            project_id,
-            region,
-            model_name
-        )
+        # Call Gemini to extract structured data, unless we've recently
+        # parsed exactly the same content
+        cache_key = response_cache_key(combined_html, url, model_name)
+        extracted_data = get_cached_response(cache_key)
+        if extracted_data is not None:
+            print(f"Using cached Gemini response for URL: {url}")
+        else:
+            extracted_data = call_gemini_api(
+                combined_html,
+                url,
+                project_id,
+                region,
+                model_name
+            )
+            cache_response(cache_key, extracted_data)
 
         # Calculate duration_weeks from dates for each session
         calculate_session_durations(extracted_data)
@@ -157,66 +344,185 @@ def parse_session_url(url, project_id, region, model_name):
         }
 
 
-def fetch_and_follow_links(base_url, max_depth=2):
+def is_allowed_by_robots(url):
     """
-    Crawl camp website up to 2 levels deep to find session information.
+    Check whether the site's robots.txt allows us to fetch a URL.
+
+    Each host's robots.txt is downloaded once and reused for
+    ROBOTS_CACHE_TTL. A 401 or 403 for robots.txt means the whole site is
+    off limits (the same rule RobotFileParser.read uses), while any other
+    failure (missing file, timeout, etc.) means everything is allowed.
 
     Args:
-        base_url: Starting URL
-        max_depth: Maximum depth to follow links (default 2)
+        url: The URL we want to fetch
 
     Returns:
-        list: List of dicts with url, html, depth
+        bool: True if we may fetch the URL
     """
-    pages = []
-    visited = set()
-    to_visit = [(base_url, 0)]
+    parsed = urlparse(url)
+    host = f"{parsed.scheme}://{parsed.netloc}"
+    now = datetime.now(timezone.utc)
+
+    with _politeness_lock:
+        cached = _robots_parsers.get(host)
+    if cached and cached['expires_at'] > now:
+        return cached['robots'].can_fetch(USER_AGENT, url)
+
+    # Download outside the lock so a slow site doesn't hold up fetches
+    # (and wait_for_host_turn) for every other host
+    robots = RobotFileParser()
+    try:
+        # Use our shared session (not RobotFileParser.read) so the
+        # request reuses the same connection and timeout
+        response = HTTP_SESSION.get(f"{host}/robots.txt", timeout=5)
+        if response.status_code == 200:
+            robots.parse(response.text.splitlines())
+        elif response.status_code in (401, 403):
+            robots.disallow_all = True
+        else:
+            robots.allow_all = True
+    except Exception as e:
+        print(f"Could not read robots.txt for {host}: {e}")
+        robots.allow_all = True
 
-    # Keywords that suggest relevant links
-    relevant_keywords = [
-        'session', 'schedule', 'registration', 'sign up', 'signup',
-        'enroll', 'camp', 'program', 'pricing', 'cost', 'dates',
-        'summer', 'week', 'age', 'grade'
-    ]
+    with _politeness_lock:
+        _robots_parsers[host] = {
+            'robots': robots,
+            'expires_at': now + ROBOTS_CACHE_TTL
+        }
 
-    while to_visit and len(pages) < 10:  # Limit to 10 pages max
-        url, depth = to_visit.pop(0)
+    return robots.can_fetch(USER_AGENT, url)
 
-        if url in visited or depth > max_depth:
-            continue
 
-        visited.add(url)
+def wait_for_host_turn(url):
+    """
+    Sleep until it's polite to send another request to this URL's host.
 
-        try:
-            # Fetch the page
-            response = requests.get(url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; SummerCampBot/1.0)'
-            })
-            response.raise_for_status()
+    Each call reserves the next time slot for the host before sleeping, so
+    parallel fetch threads line up one after another instead of all
+    hitting the site at once. Requests to different hosts don't wait on
+    each other.
+    """
+    host = urlparse(url).netloc
 
-            html = response.text
+    with _politeness_lock:
+        now = time_module.monotonic()
+        fetch_time = max(now, _next_fetch_time_by_host.get(host, now))
+        _next_fetch_time_by_host[host] = fetch_time + POLITENESS_DELAY_SECONDS
 
-            # Don't clean HTML - send raw HTML to Gemini
-            # Gemini is good at filtering out scripts/styles on its own
-            pages.append({
-                'url': url,
-                'html': html,
-                'depth': depth
-            })
+    wait = fetch_time - now
+    if wait > 0:
+        time_module.sleep(wait)
 
-            # If we haven't reached max depth, look for relevant links
-            if depth < max_depth:
-                soup = BeautifulSoup(html, 'html.parser')
-                links = identify_relevant_links(soup, url, relevant_keywords)
 
-                # Add new links to visit
-                for link in links[:5]:  # Limit to 5 links per page
-                    if link not in visited:
-                        to_visit.append((link, depth + 1))
+def fetch_page(url):
+    """
+    Fetch a single page and return its raw HTML.
 
-        except Exception as e:
-            print(f"Error fetching {url}: {e}")
-            continue
+    Args:
+        url: The URL to fetch
+
+    Returns:
+        str: The page HTML, or None if the fetch failed
+
+    Why: Kept separate from the crawl loop so several pages can be fetched
+    at the same time by a thread pool. Pages are cached for an hour
+    because camp sites link to the same pages from many places, and users
+    often parse several sessions from the same site in a row.
+    """
+    now = datetime.now(timezone.utc)
+
+    # The crawl calls this from several threads, so guard the shared cache
+    with _page_cache_lock:
+        cached = _page_cache.get(url)
+        if cached and cached['expires_at'] > now:
+            _page_cache.move_to_end(url)
+            return cached['html']
+
+    if not is_allowed_by_robots(url):
+        print(f"Skipping {url}: disallowed by robots.txt")
+        return None
+
+    try:
+        wait_for_host_turn(url)
+        response = HTTP_SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        html = response.text
+    except Exception as e:
+        print(f"Error fetching {url}: {e}")
+        return None
+
+    # Only successful fetches are cached, so failures get retried next time
+    with _page_cache_lock:
+        _page_cache[url] = {
+            'html': html,
+            'expires_at': now + PAGE_CACHE_TTL
+        }
+        _page_cache.move_to_end(url)
+        while len(_page_cache) > PAGE_CACHE_MAX_ENTRIES:
+            _page_cache.popitem(last=False)
+
+    return html
+
+
+def fetch_and_follow_links(base_url, max_depth=2):
+    """
+    Crawl camp website up to 2 levels deep to find session information.
+
+    Pages are fetched one depth level at a time. All the links found at one
+    level are downloaded in parallel, because almost all of the crawl time
+    is spent waiting on the network rather than doing work.
+
+    Args:
+        base_url: Starting URL
+        max_depth: Maximum depth to follow links (default 2)
+
+    Returns:
+        list: List of dicts with url, html, depth
+    """
+    pages = []
+    visited = set()
+    current_level = [base_url]
+    depth = 0
+
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        while current_level and depth <= max_depth and len(pages) < MAX_PAGES:
+            # Skip URLs we've already seen, and don't fetch more pages
+            # than we still have room for
+            urls = []
+            for url in current_level:
+                if url not in visited:
+                    visited.add(url)
+                    urls.append(url)
+            urls = urls[:MAX_PAGES - len(pages)]
+
+            next_level = []
+
+            # executor.map returns results in the same order as urls,
+            # so pages keep the same order as a one-at-a-time crawl
+            for url, html in zip(urls, executor.map(fetch_page, urls)):
+                if html is None:
+                    continue
+
+                # Keep the raw HTML here - parse_session_url strips scripts
+                # and styles right before sending it to Gemini
+                pages.append({
+                    'url': url,
+                    'html': html,
+                    'depth': depth
+                })
+
+                # If we haven't reached max depth, look for relevant links
+                if depth < max_depth:
+                    links = identify_relevant_links(html, url)
+
+                    # Add new links to visit
+                    for link in links[:5]:  # Limit to 5 links per page
+                        if link not in visited:
+                            next_level.append(link)
+
+            current_level = next_level
+            depth += 1
 
     return pages
 
@@ -234,10 +540,11 @@ def clean_html_for_ai(html):
     Returns:
         str: Cleaned HTML with scripts/styles removed but structure preserved
     """
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml')
 
-    # Only remove script and style tags - keep everything else for structure
-    for element in soup(['script', 'style']):
+    # Only remove non-content tags - keep everything else for structure
+    # (inline SVG icons can be surprisingly large on modern sites)
+    for element in soup(['script', 'style', 'svg', 'noscript']):
         element.decompose()
 
     # Get the cleaned HTML
@@ -246,77 +553,121 @@ def clean_html_for_ai(html):
     return cleaned
 
 
-def identify_relevant_links(soup, base_url, keywords):
+def truncate_html(html, max_chars):
+    """
+    Shorten HTML to at most max_chars, cutting at the end of a table row,
+    list item, paragraph, or table where possible.
+
+    Args:
+        html: HTML content
+        max_chars: Maximum number of characters to keep
+
+    Returns:
+        str: The HTML, shortened if it was over max_chars
+
+    Why: Cutting at an exact character count often splits a tag or a
+    session row in half, which wastes tokens and can confuse Gemini.
+    Ending on a closing tag keeps the last rows we send complete.
+    """
+    if len(html) <= max_chars:
+        return html
+
+    truncated = html[:max_chars]
+
+    # Find the closing tag that ends latest in the truncated text
+    cut_at = 0
+    for closing_tag in TRUNCATE_AT_TAGS:
+        position = truncated.rfind(closing_tag)
+        if position != -1:
+            cut_at = max(cut_at, position + len(closing_tag))
+
+    # No suitable tag near the end - fall back to a plain cut rather than
+    # throwing away a large chunk of content
+    if cut_at < max_chars // 2:
+        return truncated
+
+    return truncated[:cut_at]
+
+
+def identify_relevant_links(html, base_url, keyword_pattern=RELEVANT_KEYWORD_PATTERN):
     """
     Find links that are likely to contain session/schedule/pricing information.
 
     Args:
-        soup: BeautifulSoup object
+        html: Raw HTML of the page
         base_url: Base URL for resolving relative links
-        keywords: List of keywords to look for
+        keyword_pattern: Compiled regex matching any relevant keyword
 
     Returns:
         list: List of relevant URLs
+
+    Why lxml directly: this runs on every crawled page, and lxml's XPath
+    and text_content() do the work in C, which is much faster than
+    building a full BeautifulSoup tree just to read the links.
     """
     relevant_links = []
+    seen = set()
     base_domain = urlparse(base_url).netloc
 
-    for link_tag in soup.find_all('a', href=True):
-        href = link_tag['href']
-        link_text = link_tag.get_text().lower()
+    # Most links share a handful of hosts, so remember each host's netloc
+    # instead of running urlparse on every link
+    netloc_cache = {}
+
+    # The page is already decoded, so its encoding declaration is meaningless
+    html = XML_DECLARATION_PATTERN.sub('', html, count=1)
+
+    try:
+        tree = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        # Empty or unparseable pages simply have no links to follow
+        print(f"Could not parse links from {base_url}: {e}")
+        return []
+
+    for link_tag in tree.xpath('//a[@href]'):
+        href = link_tag.get('href')
 
         # Resolve relative URLs
         absolute_url = urljoin(base_url, href)
 
         # Only follow links on the same domain
-        if urlparse(absolute_url).netloc != base_domain:
+        # 'https://host/path/page' -> 'https://host'
+        url_prefix = '/'.join(absolute_url.split('/', 3)[:3])
+        netloc = netloc_cache.get(url_prefix)
+        if netloc is None:
+            netloc = urlparse(url_prefix).netloc
+            netloc_cache[url_prefix] = netloc
+        if netloc != base_domain:
             continue
 
-        # Check if link text contains relevant keywords
-        if any(keyword in link_text for keyword in keywords):
-            relevant_links.append(absolute_url)
-        # Also check href for keywords
-        elif any(keyword in href.lower() for keyword in keywords):
-            relevant_links.append(absolute_url)
+        # Skip duplicates while preserving order
+        if absolute_url in seen:
+            continue
 
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_links = []
-    for link in relevant_links:
-        if link not in seen:
-            seen.add(link)
-            unique_links.append(link)
+        # Check if link text or href contains relevant keywords
+        link_text = link_tag.text_content().lower()
+        href_lower = href.lower()
+        if keyword_pattern.search(link_text) or keyword_pattern.search(href_lower):
+            seen.add(absolute_url)
+            relevant_links.append(absolute_url)
 
-    return unique_links
+    return relevant_links
 
 
-def call_gemini_api(html, original_url, project_id, region, model_name):
+def build_extraction_instructions(current_year):
     """
-    Call Vertex AI Gemini to extract structured data from HTML.
+    Build the static part of the Gemini extraction prompt.
 
     Args:
-        html: HTML content to parse
-        original_url: The original URL (for context)
-        project_id: GCP project ID
-        region: GCP region
-        model_name: Gemini model name
+        current_year: The year to anchor session dates to
 
     Returns:
-        dict: Extracted structured data
-    """
-    # Initialize Vertex AI
-    vertexai.init(project=project_id, location=region)
+        str: Instructions and JSON schema shared by every parse request
 
-    # Create the model
-    model = GenerativeModel(model_name)
-
-    # Get current year for context
-    current_year = datetime.now().year
-
-    # Create the extraction prompt
-    prompt = f"""You are parsing a summer camp website to extract camp and session information.
+    Why: These instructions are identical for every URL we parse (only the
+    year changes), so they are kept separate from the page content.
+    """
+    return f"""You are parsing a summer camp website to extract camp and session information.
 
-URL: {original_url}
 CURRENT YEAR: {current_year}
 
 CRITICAL INSTRUCTIONS:
@@ -391,45 +742,210 @@ If information is not available, use null for numbers/dates, empty string for te
 REMEMBER: Extract ALL sessions found on the page, not just the first one!
 
 IMPORTANT: The content below may be in HTML format or plain text format. Look for tables, lists, or any structured data about camp sessions.
+"""
+
+
+def init_vertex_ai(project_id, region):
+    """
+    Initialize the Vertex AI SDK once per project/region.
+
+    Why: vertexai.init looks up credentials and project settings, which adds
+    latency to every Gemini call if it's repeated each time.
+    """
+    if (project_id, region) not in _vertex_ai_initialized:
+        vertexai.init(project=project_id, location=region)
+        _vertex_ai_initialized.add((project_id, region))
+
+
+def get_model(project_id, region, model_name):
+    """
+    Get a reusable Gemini model for the given project, region and model name.
+
+    Args:
+        project_id: GCP project ID
+        region: GCP region
+        model_name: Gemini model name
+
+    Returns:
+        GenerativeModel: Shared model bound to that project and region
+
+    Why: Creating a GenerativeModel builds a new API client, so we create
+    each model once and share it between requests. A model uses whatever
+    project and region vertexai.init last set when it's created, so the
+    cache is keyed on all three and Vertex AI is pointed at the right
+    project just before a new model is built.
+    """
+    model_key = (project_id, region, model_name)
+    if model_key not in _models:
+        vertexai.init(project=project_id, location=region)
+        _models[model_key] = GenerativeModel(model_name)
+    return _models[model_key]
+
+
+class JsonObjectScanner:
+    """
+    Finds the first complete top-level JSON object in streamed text.
+
+    Feed it each chunk as it arrives. It remembers where it got to (brace
+    depth, whether it's inside a string, and so on), so every character is
+    looked at once no matter how many chunks there are.
+
+    Why: call_gemini_api used to rescan the whole response each time a
+    chunk contained '}', which gets slow for long responses with many
+    small chunks.
+    """
+
+    def __init__(self):
+        # Chunks of text from the object's opening '{' onward
+        self.object_parts = []
+        # Set once we've seen the closing brace (whether or not it parsed)
+        self.finished = False
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk):
+        """
+        Scan the next piece of text.
+
+        Args:
+            chunk: Text that arrived after everything fed so far
+
+        Returns:
+            dict: The parsed object once it is complete and valid, else None
+
+        Why: Anything that doesn't parse cleanly here is left for the more
+        forgiving cleanup that runs on the full response.
+        """
+        if self.finished:
+            return None
+
+        if not self.object_parts:
+            # Skip anything before the object starts
+            start = chunk.find('{')
+            if start == -1:
+                return None
+            chunk = chunk[start:]
+
+        for i, char in enumerate(chunk):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == '{':
+                self.depth += 1
+            elif char == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    self.finished = True
+                    self.object_parts.append(chunk[:i + 1])
+                    try:
+                        data = orjson.loads(''.join(self.object_parts))
+                    except orjson.JSONDecodeError:
+                        return None
+                    return data if isinstance(data, dict) else None
+
+        self.object_parts.append(chunk)
+        return None
+
+
+def parse_complete_json_object(text):
+    """
+    Parse the first complete top-level JSON object in a partial response.
+
+    Args:
+        text: Response text received so far
+
+    Returns:
+        dict: The parsed object, or None if it isn't complete or valid yet
+    """
+    return JsonObjectScanner().feed(text)
+
+
+def call_gemini_api(html, original_url, project_id, region, model_name):
+    """
+    Call Vertex AI Gemini to extract structured data from HTML.
+
+    Args:
+        html: HTML content to parse
+        original_url: The original URL (for context)
+        project_id: GCP project ID
+        region: GCP region
+        model_name: Gemini model name
+
+    Returns:
+        dict: Extracted structured data
+    """
+    # Initialize Vertex AI (only does work the first time)
+    init_vertex_ai(project_id, region)
+
+    # Get current year for context
+    current_year = datetime.now().year
+
+    # Only the URL and page content change between requests
+    page_prompt = f"""URL: {original_url}
 
 Content:
 {html}
 """
 
-    # Generate content with JSON mode
-    generation_config = GenerationConfig(
-        temperature=0.1,  # Low temperature for more consistent output
-        max_output_tokens=8192,
-    )
+    model = get_model(project_id, region, model_name)
+    prompt = build_extraction_instructions(current_year) + "\n" + page_prompt
 
-    response = model.generate_content(
+    # Stream the response so we can stop reading as soon as a complete
+    # JSON object has arrived, instead of waiting for any trailing commentary
+    response_text = ''
+    json_scanner = JsonObjectScanner()
+    for chunk in model.generate_content(
         prompt,
-        generation_config=generation_config
-    )
+        generation_config=GENERATION_CONFIG,
+        stream=True
+    ):
+        try:
+            chunk_text = chunk.text
+        except ValueError:
+            # Some chunks (e.g. the final finish-reason chunk) have no text
+            continue
+        response_text += chunk_text
+
+        data = json_scanner.feed(chunk_text)
+        if data is not None:
+            print(f"Successfully parsed JSON. Sessions found: {len(data.get('sessions', []))}")
+            if len(data.get('sessions', [])) == 0:
+                print(f"WARNING: No sessions in response. Full response: {response_text[:1000]}")
+            return data
 
     # Extract JSON from response
-    response_text = response.text.strip()
+    response_text = response_text.strip()
 
     # Remove markdown code blocks if present
-    if '```json' in response_text or '```' in response_text:
-        response_text = re.sub(r'^.*?```json?\s*', '', response_text, flags=re.DOTALL)
-        response_text = re.sub(r'\s*```.*$', '', response_text, flags=re.DOTALL)
+    if '```' in response_text:
+        response_text = MARKDOWN_FENCE_PATTERN.sub('', response_text)
 
     # Try to find JSON in the response (in case there's explanatory text before/after)
-    json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-    if json_match:
-        response_text = json_match.group(0)
+    # Plain find/rfind scan the string once, unlike a backtracking regex
+    json_start = response_text.find('{')
+    json_end = response_text.rfind('}')
+    if json_start != -1 and json_end > json_start:
+        response_text = response_text[json_start:json_end + 1]
 
     # Try to fix common JSON errors before parsing
     # Fix: trailing commas before closing braces/brackets
-    response_text = re.sub(r',(\s*[}\]])', r'\1', response_text)
+    response_text = TRAILING_COMMA_PATTERN.sub(r'\1', response_text)
 
     # Fix: missing comma after closing brace/bracket when next line starts with quote
-    response_text = re.sub(r'(\}|\])\s*\n\s*"', r'\1,\n  "', response_text)
+    response_text = MISSING_COMMA_PATTERN.sub(r'\1,\n  "', response_text)
 
     # Parse JSON
+    # orjson is much faster than the json module on large session lists;
+    # its JSONDecodeError is a subclass of json.JSONDecodeError
     try:
-        data = json.loads(response_text)
+        data = orjson.loads(response_text)
         print(f"Successfully parsed JSON. Sessions found: {len(data.get('sessions', []))}")
         if len(data.get('sessions', [])) == 0:
             print(f"WARNING: No sessions in response. Full response: {response_text[:1000]}")
@@ -460,6 +976,10 @@ def detect_stale_data(extracted_data, current_date=None):
     if current_date is None:
         current_date = datetime.now()
 
+    # These don't change from session to session, so work them out once
+    current_year = current_date.year
+    stale_cutoff = current_date - timedelta(days=30)
+
     warnings = []
 
     sessions = extracted_data.get('sessions', [])
@@ -471,19 +991,19 @@ def detect_stale_data(extracted_data, current_date=None):
         start_date_str = session.get('session_start_date')
         if start_date_str:
             try:
-                start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
+                start_date = parse_date(start_date_str)
 
                 # Check if the year is in the past
-                if start_date.year < current_date.year:
+                if start_date.year < current_year:
                     session_warnings.append({
                         'field': 'session_start_date',
                         'confidence': 'high',
-                        'issue': f'Session date is from {start_date.year}, but we are in {current_date.year}',
+                        'issue': f'Session date is from {start_date.year}, but we are in {current_year}',
                         'suggestion': 'Update the year to current year or verify this is correct'
                     })
 
                 # Check 2: Date is in the past (high confidence)
-                elif start_date < current_date and (start_date < current_date - timedelta(days=30)):
+                elif start_date < stale_cutoff:
                     session_warnings.append({
                         'field': 'session_start_date',
                         'confidence': 'high',
@@ -494,18 +1014,18 @@ def detect_stale_data(extracted_data, current_date=None):
                 # Check 3: Monday misalignment (medium confidence)
                 # Sessions should typically start on Monday
                 # Only check if the date is in the current or past year
-                elif start_date.year <= current_date.year and start_date.weekday() != 0:  # 0 = Monday
+                elif start_date.year <= current_year and start_date.weekday() != MONDAY:
                     # Check if this date WAS a Monday last year
                     last_year_date = start_date.replace(year=start_date.year - 1)
-                    if last_year_date.weekday() == 0:
+                    if last_year_date.weekday() == MONDAY:
                         session_warnings.append({
                             'field': 'session_start_date',
                             'confidence': 'medium',
                             'issue': f'Session starts on {start_date.strftime("%A")} ({start_date_str}), but this was a Monday in {start_date.year - 1}',
-                            'suggestion': f'This may be last year\'s schedule. Consider adjusting to the corresponding Monday in {current_date.year}.'
+                            'suggestion': f'This may be last year\'s schedule. Consider adjusting to the corresponding Monday in {current_year}.'
                         })
                     # Even if not a Monday last year, warn about non-Monday start (low priority)
-                    elif start_date.year == current_date.year and start_date > current_date:
+                    elif start_date.year == current_year and start_date > current_date:
                         session_warnings.append({
                             'field': 'session_start_date',
                             'confidence': 'low',
@@ -520,7 +1040,7 @@ def detect_stale_data(extracted_data, current_date=None):
         reg_date_str = session.get('registration_open_date')
         if reg_date_str:
             try:
-                reg_date = datetime.strptime(reg_date_str, '%Y-%m-%d')
+                reg_date = parse_date(reg_date_str)
                 if reg_date < current_date:
                     session_warnings.append({
                         'field': 'registration_open_date',
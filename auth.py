@@ -11,11 +11,29 @@ Only users whose email addresses are in the ALLOWED_EMAILS configuration
 can access the application.
 """
 
-from functools import wraps
+from functools import wraps, lru_cache
 from flask import Blueprint, redirect, request, session, url_for, render_template, current_app
 from google_auth_oauthlib.flow import Flow
-from google.auth.transport import requests as google_requests
+from google.auth import jwt
 import os
+import re
+import threading
+import time
+import requests
+
+
+# Google's public certificates for verifying ID token signatures
+# These rotate every few hours, and Google tells us how long each copy is
+# good for (Cache-Control max-age). We keep a copy in memory instead of
+# downloading them on every login. See get_google_certs.
+GOOGLE_OAUTH2_CERTS_URL = 'https://www.googleapis.com/oauth2/v1/certs'
+GOOGLE_ISSUERS = ('accounts.google.com', 'https://accounts.google.com')
+DEFAULT_CERTS_MAX_AGE_SECONDS = 3600
+_google_certs = {'certs': None, 'expires_at': 0}
+_google_certs_lock = threading.Lock()
+
+# Reused so repeat certificate downloads keep the HTTPS connection open
+_certs_http_session = requests.Session()
 
 
 # Create Blueprint for auth routes
@@ -33,6 +51,9 @@ def create_flow():
     Returns:
         Flow: Configured OAuth flow object
     """
+    # Build the callback URL once - it's needed in two places below
+    callback_url = url_for('auth.callback', _external=True)
+
     flow = Flow.from_client_config(
         {
             "web": {
@@ -40,18 +61,101 @@ def create_flow():
                 "client_secret": current_app.config['GOOGLE_CLIENT_SECRET'],
                 "auth_uri": "https://accounts.google.com/o/oauth2/auth",
                 "token_uri": "https://oauth2.googleapis.com/token",
-                "redirect_uris": [url_for('auth.callback', _external=True)]
+                "redirect_uris": [callback_url]
             }
         },
         scopes=current_app.config['GOOGLE_OAUTH_SCOPES']
     )
 
     # Set the redirect URI to the callback route
-    flow.redirect_uri = url_for('auth.callback', _external=True)
+    flow.redirect_uri = callback_url
 
     return flow
 
 
+def get_google_certs(force_refresh=False):
+    """
+    Get Google's current ID token signing certificates.
+
+    Args:
+        force_refresh: Download fresh certificates even if our copy hasn't expired
+
+    Returns:
+        dict: Key ID -> PEM certificate
+
+    Why: Downloading the certificates costs an extra HTTPS round trip on
+    every login. Google publishes how long they may be cached, so we reuse
+    them until then.
+    """
+    with _google_certs_lock:
+        now = time.time()
+        if force_refresh or _google_certs['certs'] is None or now >= _google_certs['expires_at']:
+            response = _certs_http_session.get(GOOGLE_OAUTH2_CERTS_URL, timeout=10)
+            response.raise_for_status()
+
+            max_age = DEFAULT_CERTS_MAX_AGE_SECONDS
+            match = re.search(r'max-age=(\d+)', response.headers.get('Cache-Control', ''))
+            if match:
+                max_age = int(match.group(1))
+
+            _google_certs['certs'] = response.json()
+            _google_certs['expires_at'] = now + max_age
+
+        return _google_certs['certs']
+
+
+def verify_google_id_token(token, client_id):
+    """
+    Verify a Google ID token and return its claims.
+
+    Does the same checks as google.oauth2.id_token.verify_oauth2_token
+    (signature, expiry, audience, issuer) but with cached certificates.
+
+    Args:
+        token: The encoded ID token from the OAuth flow
+        client_id: Our OAuth client ID (the expected audience)
+
+    Returns:
+        dict: The token's claims (email, name, picture, ...)
+
+    Raises:
+        ValueError: If the token is invalid
+    """
+    certs = get_google_certs()
+
+    # Google may have rotated keys since we cached them - if the token was
+    # signed with a key we don't know yet, fetch a fresh copy once
+    key_id = jwt.decode_header(token).get('kid')
+    if key_id not in certs:
+        certs = get_google_certs(force_refresh=True)
+
+    id_info = jwt.decode(token, certs=certs, audience=client_id)
+
+    if id_info.get('iss') not in GOOGLE_ISSUERS:
+        raise ValueError(f"Wrong issuer: {id_info.get('iss')}")
+
+    return id_info
+
+
+@lru_cache(maxsize=1)
+def allowed_emails_set():
+    """
+    Get the email allowlist as a lowercase frozenset.
+
+    Returns:
+        frozenset: Allowed email addresses, lowercased and trimmed
+
+    Why: Email addresses aren't case-sensitive, so both sides of the check
+    are lowercased. The set is built once (the config doesn't change while
+    the app is running) and gives a fast membership check.
+    """
+    return frozenset(
+        email.strip().lower()
+        for email in current_app.config['ALLOWED_EMAILS']
+        if email.strip()
+    )
+
+
 def login_required(f):
     """
     Decorator to protect routes that require authentication.
@@ -151,16 +255,10 @@ def callback():
     # Get credentials from the flow
     credentials = flow.credentials
 
-    # Fetch user info from Google
-    # We use the credentials to call Google's userinfo API
-    id_info_request = google_requests.Request()
-    from google.oauth2 import id_token
-
     try:
         # Verify and decode the ID token to get user information
-        id_info = id_token.verify_oauth2_token(
+        id_info = verify_google_id_token(
             credentials.id_token,
-            id_info_request,
             current_app.config['GOOGLE_CLIENT_ID']
         )
 
@@ -169,9 +267,8 @@ def callback():
         user_name = id_info.get('name')
         user_picture = id_info.get('picture')
 
-        # Check if user's email is in the allowlist
-        allowed_emails = current_app.config['ALLOWED_EMAILS']
-        if user_email not in allowed_emails:
+        # Check if user's email is in the allowlist (case-insensitive)
+        if (user_email or '').lower() not in allowed_emails_set():
             # User not authorized - show error page
             return render_template('unauthorized.html', email=user_email)
 
@@ -5,22 +5,320 @@ This module provides functions to create, update, and delete calendar events
 for booked summer camps and registration reminders.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from googleapiclient.discovery import build
+from flask import g, has_app_context
+from googleapiclient.errors import HttpError
 from google.oauth2.credentials import Credentials
-from dateutil import parser
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+
+
+# Errors go through logging (not print) so Cloud Logging records their
+# severity and traceback, and so rate limits can be told apart from bugs
+logger = logging.getLogger(__name__)
+
+# HTTP statuses that mean "try again later" from the Calendar API
+# 403 only counts when the reason is a rate limit (see is_retriable_error)
+RETRIABLE_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+# Maximum number of requests Google accepts in one batch HTTP request
+CALENDAR_BATCH_LIMIT = 50
+
+# Keep-alive HTTP connection to Google for each thread, as
+# (token fingerprint, AuthorizedHttp). httplib2 connections aren't
+# thread-safe, so threads don't share them.
+_thread_http = threading.local()
+
+# Background threads that send Calendar writes after the page has returned
+CALENDAR_WORKERS = 8
+_calendar_executor = ThreadPoolExecutor(max_workers=CALENDAR_WORKERS, thread_name_prefix='calendar')
+
+
+def is_retriable_error(error):
+    """
+    Decide whether a Calendar API error is temporary and worth retrying.
+
+    Args:
+        error: HttpError raised by the Google API client
+
+    Returns:
+        bool: True for rate limits and server errors, False otherwise
+    """
+    status = error.resp.status
+    if status in RETRIABLE_STATUSES:
+        return True
+
+    if status == 403:
+        # 403 is also used for real permission problems, so check the reason
+        try:
+            details = json.loads(error.content)
+            reason = details['error']['errors'][0]['reason']
+        except (ValueError, KeyError, IndexError, TypeError):
+            return False
+        return reason in RATE_LIMIT_REASONS
+
+    return False
+
+
+def classify_error(error):
+    """
+    Sort a Calendar error into a short category for log messages.
+
+    Args:
+        error: Exception raised while talking to the Calendar API
+
+    Returns:
+        str: 'rate_limit', 'server_error', 'not_found', 'auth', 'http_<status>',
+             or the exception's class name for non-HTTP errors
+    """
+    if not isinstance(error, HttpError):
+        return type(error).__name__
+
+    status = error.resp.status
+    if status == 429 or (status == 403 and is_retriable_error(error)):
+        return 'rate_limit'
+    if status >= 500:
+        return 'server_error'
+    if status in (404, 410):
+        return 'not_found'
+    if status in (401, 403):
+        return 'auth'
+    return f'http_{status}'
+
+
+def execute_with_backoff(request, max_retries=5, base_delay=1.0, max_delay=32.0):
+    """
+    Execute a Google API request, retrying temporary failures.
+
+    Waits 1s, 2s, 4s, ... (plus a little random jitter) between attempts,
+    following Google's recommended exponential backoff.
+
+    Args:
+        request: An unexecuted API request, e.g. service.events().insert(...)
+        max_retries: How many times to retry before giving up
+        base_delay: Delay before the first retry, in seconds
+        max_delay: Longest delay between retries, in seconds
+
+    Returns:
+        The API response
+
+    Raises:
+        HttpError: If the error isn't retriable or we ran out of retries
+
+    Why: Calendar quotas refill within seconds, so booking several weeks
+    at once can hit a rate limit that a short wait would have avoided.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            if attempt == max_retries or not is_retriable_error(e):
+                raise
+            delay = min(max_delay, base_delay * (2 ** attempt)) + random.random()
+            logger.warning("Calendar API %s (%s), retrying in %.1fs",
+                           e.resp.status, classify_error(e), delay)
+            time.sleep(delay)
+
+
+def execute_batch_with_backoff(service, requests, callback, max_retries=5, base_delay=1.0, max_delay=32.0):
+    """
+    Send API requests in batches, retrying the ones that hit temporary errors.
+
+    Args:
+        service: Calendar API service from get_calendar_service
+        requests: Dict of request ID (a string) -> unexecuted API request
+        callback: Called as callback(request_id, response, exception) once
+                  per request with its final outcome (exception is None on
+                  success)
+        max_retries: How many times to re-send failed requests
+        base_delay: Delay before the first retry, in seconds
+        max_delay: Longest delay between retries, in seconds
+
+    Why: A batch HTTP request only raises if the whole batch fails. Each
+    request inside it succeeds or fails on its own, and rate limits
+    (403/429) and server errors are reported per request. Booking many
+    weeks at once is exactly when those happen, so the failed requests are
+    collected and re-sent in a follow-up batch after a backoff delay.
+    """
+    pending = dict(requests)
+
+    for attempt in range(max_retries + 1):
+        retry = {}
+
+        def handle_result(request_id, response, exception):
+            if (exception is not None and attempt < max_retries
+                    and isinstance(exception, HttpError) and is_retriable_error(exception)):
+                retry[request_id] = pending[request_id]
+            else:
+                callback(request_id, response, exception)
+
+        # Google allows at most 50 requests per batch
+        request_ids = list(pending)
+        for chunk_start in range(0, len(request_ids), CALENDAR_BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=handle_result)
+            for request_id in request_ids[chunk_start:chunk_start + CALENDAR_BATCH_LIMIT]:
+                batch.add(pending[request_id], request_id=request_id)
+            try:
+                execute_with_backoff(batch)
+            except Exception as e:
+                logger.exception("Calendar batch request failed (%s)", classify_error(e))
+
+        if not retry:
+            return
+
+        delay = min(max_delay, base_delay * (2 ** attempt)) + random.random()
+        logger.warning("Calendar batch: %d request(s) hit temporary errors, retrying in %.1fs",
+                       len(retry), delay)
+        time.sleep(delay)
+        pending = retry
+
+
+def parse_calendar_date(value):
+    """
+    Turn a date from Datastore or a form into a datetime.
+
+    Args:
+        value: A datetime, or a date string such as '2025-06-16'
+
+    Returns:
+        datetime: The parsed date
+
+    Why: Our dates are almost always datetimes or ISO strings, which
+    datetime.fromisoformat handles very quickly. dateutil's parser is much
+    slower, so it's only used for anything fromisoformat can't read.
+    """
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Imported here so most requests never load dateutil
+        from dateutil import parser
+        return parser.parse(value)
+
+
+def new_event_id():
+    """
+    Generate an ID for a calendar event before it's created.
+
+    Returns:
+        str: 32 lowercase hex characters (Google accepts a-v and 0-9)
+
+    Why: If Google creates an event but the response is lost, our retry
+    sends the insert again. With our own event ID, the retry gets a
+    409 "already exists" instead of creating a duplicate event.
+    """
+    return uuid.uuid4().hex
+
+
+def is_already_created_error(error):
+    """
+    Check whether an insert failed because the event ID already exists.
+
+    Args:
+        error: Exception raised by the Google API client
+
+    Returns:
+        bool: True for a 409 Conflict from the Calendar API
+    """
+    return isinstance(error, HttpError) and error.resp.status == 409
+
+
+def insert_event(service, event):
+    """
+    Insert an event that carries its own ID (see new_event_id).
+
+    Args:
+        service: Google Calendar API service object
+        event: Event body including an 'id'
+
+    Returns:
+        str: The event's ID
+
+    Raises:
+        HttpError: If the insert fails for any other reason
+    """
+    try:
+        created_event = execute_with_backoff(service.events().insert(calendarId='primary', body=event))
+        return created_event['id']
+    except HttpError as e:
+        if is_already_created_error(e):
+            # An earlier attempt went through; the event is already there
+            return event['id']
+        raise
 
 
 def get_calendar_service(session_credentials):
     """
-    Create a Google Calendar API service instance from session credentials.
+    Get a Google Calendar API service instance for the session credentials.
+
+    The service is cached on Flask's g for the rest of the request, so a
+    booking that creates an event and a reminder only builds it once.
 
     Args:
         session_credentials: OAuth credentials from session['credentials']
 
     Returns:
         Google Calendar API service object
+
+    Why: static_discovery uses the API description bundled with
+    google-api-python-client, so building never fetches it over the network.
+    """
+    # Fingerprint the token so a refreshed token gets a fresh service
+    fingerprint = hashlib.sha256(session_credentials['token'].encode()).hexdigest()
+
+    if has_app_context():
+        cached = g.get('calendar_service')
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+
+    # Imported here because the discovery module pulls in a lot of code,
+    # and most requests (and app startup) never need the Calendar API
+    from googleapiclient.discovery import build
+
+    service = build(
+        'calendar', 'v3',
+        http=get_authorized_http(session_credentials, fingerprint),
+        cache_discovery=False,
+        static_discovery=True
+    )
+
+    if has_app_context():
+        g.calendar_service = (fingerprint, service)
+
+    return service
+
+
+def get_authorized_http(session_credentials, fingerprint):
     """
+    Get this thread's authorized HTTP connection for the given credentials.
+
+    Args:
+        session_credentials: OAuth credentials from session['credentials']
+        fingerprint: Hash of the access token (see get_calendar_service)
+
+    Returns:
+        google_auth_httplib2.AuthorizedHttp that adds the OAuth token to requests
+
+    Why: Every new connection to Google needs a TLS handshake (~100ms).
+    Reusing the same connection keeps it open between Calendar calls, so
+    only the first call on each thread pays for the handshake.
+    """
+    cached = getattr(_thread_http, 'cached', None)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+
+    # Imported here for the same reason as in get_calendar_service
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.http import build_http
+
     credentials = Credentials(
         token=session_credentials['token'],
         refresh_token=session_credentials.get('refresh_token'),
@@ -30,7 +328,98 @@ def get_calendar_service(session_credentials):
         scopes=session_credentials.get('scopes')
     )
 
-    return build('calendar', 'v3', credentials=credentials)
+    # build_http applies the API client's default timeout
+    authorized_http = AuthorizedHttp(credentials, http=build_http())
+    _thread_http.cached = (fingerprint, authorized_http)
+    return authorized_http
+
+
+def format_booking_description(kid, camp, session):
+    """
+    Build the description text shown on a booked camp's calendar event.
+
+    Args:
+        kid: Kid entity dict with name
+        camp: Camp entity dict with name, phone, website
+        session: Session entity dict with name, times, costs
+
+    Returns:
+        str: One detail per line
+    """
+    # Each optional line is either "\n<detail>" or empty, so the final
+    # f-string only includes the details this session actually has
+    times = ''
+    if session.get('start_time') and session.get('end_time'):
+        times = f"\nTime: {session['start_time']} - {session['end_time']}"
+
+    dropoff = ''
+    if session.get('dropoff_window_start') and session.get('dropoff_window_end'):
+        dropoff = f"\nDrop-off: {session['dropoff_window_start']} - {session['dropoff_window_end']}"
+
+    pickup = ''
+    if session.get('pickup_window_start') and session.get('pickup_window_end'):
+        pickup = f"\nPick-up: {session['pickup_window_start']} - {session['pickup_window_end']}"
+
+    cost = f"\nCost: ${session['cost']:.2f}" if session.get('cost') else ''
+    phone = f"\nPhone: {camp['phone']}" if camp.get('phone') else ''
+    website = f"\nWebsite: {camp['website']}" if camp.get('website') else ''
+    url = f"\nSession Info: {session['url']}" if session.get('url') else ''
+
+    return (
+        f"Camp: {camp['name']}\nSession: {session['name']}\nKid: {kid['name']}"
+        f"{times}{dropoff}{pickup}{cost}{phone}{website}{url}"
+    )
+
+
+def build_booking_event_body(kid, camp, session, week, description=None):
+    """
+    Build the Calendar API event body for a booked summer camp.
+
+    This only builds the dict - it doesn't call the Calendar API - so it can
+    be shared by single and batched event creation.
+
+    Args:
+        kid: Kid entity dict with name
+        camp: Camp entity dict with name, phone, website
+        session: Session entity dict with name, times, costs
+        week: Week entity dict with start_date and end_date
+        description: Pre-built description (optional, built from the
+                     kid/camp/session if not given)
+
+    Returns:
+        dict: Event body for events().insert
+    """
+    # Parse dates
+    start_date = parse_calendar_date(week['start_date'])
+    end_date = parse_calendar_date(week['end_date'])
+
+    # End date for calendar event is exclusive (next day after end_date)
+    event_end_date = end_date + timedelta(days=1)
+
+    if description is None:
+        description = format_booking_description(kid, camp, session)
+
+    return {
+        'id': new_event_id(),
+        'summary': f"{kid['name']} - {camp['name']}",
+        'description': description,
+        'start': {
+            'date': start_date.date().isoformat(),
+            'timeZone': 'America/Los_Angeles',
+        },
+        'end': {
+            'date': event_end_date.date().isoformat(),
+            'timeZone': 'America/Los_Angeles',
+        },
+        'colorId': '10',  # Green color for booked camps
+        'reminders': {
+            'useDefault': False,
+            'overrides': [
+                {'method': 'popup', 'minutes': 24 * 60},  # 1 day before
+                {'method': 'popup', 'minutes': 7 * 24 * 60},  # 1 week before
+            ],
+        },
+    }
 
 
 def create_booking_event(session_credentials, parent, kid, camp, session, week):
@@ -53,72 +442,124 @@ def create_booking_event(session_credentials, parent, kid, camp, session, week):
     """
     try:
         service = get_calendar_service(session_credentials)
+        event = build_booking_event_body(kid, camp, session, week)
 
-        # Parse dates
-        start_date = week['start_date'] if isinstance(week['start_date'], datetime) else parser.parse(week['start_date'])
-        end_date = week['end_date'] if isinstance(week['end_date'], datetime) else parser.parse(week['end_date'])
+        return insert_event(service, event)
 
-        # End date for calendar event is exclusive (next day after end_date)
-        event_end_date = end_date + timedelta(days=1)
+    except Exception as e:
+        logger.exception("Calendar create_booking_event failed (%s)", classify_error(e))
+        return None
 
-        # Build event description with session details
-        description_parts = [
-            f"Camp: {camp['name']}",
-            f"Session: {session['name']}",
-            f"Kid: {kid['name']}"
-        ]
-
-        if session.get('start_time') and session.get('end_time'):
-            description_parts.append(f"Time: {session['start_time']} - {session['end_time']}")
-
-        if session.get('dropoff_window_start') and session.get('dropoff_window_end'):
-            description_parts.append(f"Drop-off: {session['dropoff_window_start']} - {session['dropoff_window_end']}")
-
-        if session.get('pickup_window_start') and session.get('pickup_window_end'):
-            description_parts.append(f"Pick-up: {session['pickup_window_start']} - {session['pickup_window_end']}")
-
-        if session.get('cost'):
-            description_parts.append(f"Cost: ${session['cost']:.2f}")
-
-        if camp.get('phone'):
-            description_parts.append(f"Phone: {camp['phone']}")
-
-        if camp.get('website'):
-            description_parts.append(f"Website: {camp['website']}")
-
-        if session.get('url'):
-            description_parts.append(f"Session Info: {session['url']}")
-
-        description = "\n".join(description_parts)
-
-        # Create event
-        event = {
-            'summary': f"{kid['name']} - {camp['name']}",
-            'description': description,
-            'start': {
-                'date': start_date.strftime('%Y-%m-%d'),
-                'timeZone': 'America/Los_Angeles',
-            },
-            'end': {
-                'date': event_end_date.strftime('%Y-%m-%d'),
-                'timeZone': 'America/Los_Angeles',
-            },
-            'colorId': '10',  # Green color for booked camps
-            'reminders': {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'popup', 'minutes': 24 * 60},  # 1 day before
-                    {'method': 'popup', 'minutes': 7 * 24 * 60},  # 1 week before
-                ],
-            },
-        }
-
-        created_event = service.events().insert(calendarId='primary', body=event).execute()
-        return created_event['id']
 
+def create_booking_events_batch(session_credentials, bookings):
+    """
+    Create calendar events for several booked weeks in as few requests as possible.
+
+    Uses the Calendar API's batch endpoint, which sends up to 50 inserts in
+    a single HTTP request.
+
+    Args:
+        session_credentials: OAuth credentials from session['credentials']
+        bookings: List of dicts, each with 'parent', 'kid', 'camp', 'session',
+                  and 'week' entity dicts (same as create_booking_event)
+
+    Returns:
+        list: Created event IDs in the same order as bookings, with None
+              for any event that couldn't be created
+
+    Why: Booking a multi-week session creates one event per week. Sending
+    them one at a time costs a full round trip to Google for each week.
+    """
+    event_ids = [None] * len(bookings)
+    if not bookings:
+        return event_ids
+
+    try:
+        service = get_calendar_service(session_credentials)
+        # Every week of a booking shares the same description, so build it
+        # once per kid/camp/session and reuse it
+        descriptions = {}
+        event_bodies = []
+        for b in bookings:
+            key = (b['kid']['name'], b['camp'].get('id'), b['session'].get('id'))
+            if key not in descriptions:
+                descriptions[key] = format_booking_description(b['kid'], b['camp'], b['session'])
+            event_bodies.append(
+                build_booking_event_body(b['kid'], b['camp'], b['session'], b['week'], descriptions[key])
+            )
     except Exception as e:
-        print(f"Error creating calendar event: {e}")
-        return None
+        logger.exception("Calendar create_booking_events_batch failed (%s)", classify_error(e))
+        return event_ids
+
+    def collect_event_id(request_id, response, exception):
+        # Called once per event; request_id is the event's index as a string
+        index = int(request_id)
+        if exception is None:
+            event_ids[index] = response['id']
+        elif is_already_created_error(exception):
+            # A retried request re-sent an event Google had already created
+            event_ids[index] = event_bodies[index]['id']
+        else:
+            logger.error("Calendar batch insert %s failed (%s): %s",
+                         request_id, classify_error(exception), exception)
+
+    execute_batch_with_backoff(
+        service,
+        {str(index): service.events().insert(calendarId='primary', body=event)
+         for index, event in enumerate(event_bodies)},
+        collect_event_id
+    )
+
+    return event_ids
+
+
+def build_registration_reminder_body(camp, session):
+    """
+    Build the Calendar API event body for a registration opening reminder.
+
+    Args:
+        camp: Camp entity dict with name
+        session: Session entity dict with name and registration_open_date
+
+    Returns:
+        dict: Event body for events().insert
+    """
+    # Parse registration date
+    reg_date = parse_calendar_date(session['registration_open_date'])
+
+    # Event end date is next day (all-day events are exclusive)
+    event_end_date = reg_date + timedelta(days=1)
+
+    # Build description (optional lines are empty when the detail is missing)
+    url = f"\nRegistration URL: {session['url']}" if session.get('url') else ''
+    website = f"\nCamp Website: {camp['website']}" if camp.get('website') else ''
+    phone = f"\nPhone: {camp['phone']}" if camp.get('phone') else ''
+    description = (
+        f"Camp: {camp['name']}\nSession: {session['name']}\nRemember to register!"
+        f"{url}{website}{phone}"
+    )
+
+    return {
+        'id': new_event_id(),
+        'summary': f"📝 Register for {camp['name']} - {session['name']}",
+        'description': description,
+        'start': {
+            'date': reg_date.date().isoformat(),
+            'timeZone': 'America/Los_Angeles',
+        },
+        'end': {
+            'date': event_end_date.date().isoformat(),
+            'timeZone': 'America/Los_Angeles',
+        },
+        'colorId': '11',  # Red color for registration reminders
+        'reminders': {
+            'useDefault': False,
+            'overrides': [
+                {'method': 'popup', 'minutes': 0},  # Morning of
+                {'method': 'popup', 'minutes': 24 * 60},  # Day before
+            ],
+        },
+    }
 
 
 def create_registration_reminder(session_credentials, parent, camp, session):
@@ -142,60 +583,12 @@ def create_registration_reminder(session_credentials, parent, camp, session):
             return None
 
         service = get_calendar_service(session_credentials)
+        event = build_registration_reminder_body(camp, session)
 
-        # Parse registration date
-        reg_date = session['registration_open_date']
-        if isinstance(reg_date, str):
-            reg_date = parser.parse(reg_date)
-
-        # Event end date is next day (all-day events are exclusive)
-        event_end_date = reg_date + timedelta(days=1)
-
-        # Build description
-        description_parts = [
-            f"Camp: {camp['name']}",
-            f"Session: {session['name']}",
-            "Remember to register!"
-        ]
-
-        if session.get('url'):
-            description_parts.append(f"Registration URL: {session['url']}")
-
-        if camp.get('website'):
-            description_parts.append(f"Camp Website: {camp['website']}")
-
-        if camp.get('phone'):
-            description_parts.append(f"Phone: {camp['phone']}")
-
-        description = "\n".join(description_parts)
-
-        # Create event
-        event = {
-            'summary': f"📝 Register for {camp['name']} - {session['name']}",
-            'description': description,
-            'start': {
-                'date': reg_date.strftime('%Y-%m-%d'),
-                'timeZone': 'America/Los_Angeles',
-            },
-            'end': {
-                'date': event_end_date.strftime('%Y-%m-%d'),
-                'timeZone': 'America/Los_Angeles',
-            },
-            'colorId': '11',  # Red color for registration reminders
-            'reminders': {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'popup', 'minutes': 0},  # Morning of
-                    {'method': 'popup', 'minutes': 24 * 60},  # Day before
-                ],
-            },
-        }
-
-        created_event = service.events().insert(calendarId='primary', body=event).execute()
-        return created_event['id']
+        return insert_event(service, event)
 
     except Exception as e:
-        print(f"Error creating registration reminder: {e}")
+        logger.exception("Calendar create_registration_reminder failed (%s)", classify_error(e))
         return None
 
 
@@ -219,45 +612,27 @@ def update_booking_event(session_credentials, calendar_event_id, parent, kid, ca
         service = get_calendar_service(session_credentials)
 
         # Get existing event
-        event = service.events().get(calendarId='primary', eventId=calendar_event_id).execute()
+        event = execute_with_backoff(service.events().get(calendarId='primary', eventId=calendar_event_id))
 
         # Parse dates
-        start_date = week['start_date'] if isinstance(week['start_date'], datetime) else parser.parse(week['start_date'])
-        end_date = week['end_date'] if isinstance(week['end_date'], datetime) else parser.parse(week['end_date'])
+        start_date = parse_calendar_date(week['start_date'])
+        end_date = parse_calendar_date(week['end_date'])
         event_end_date = end_date + timedelta(days=1)
 
         # Update event fields
         event['summary'] = f"{kid['name']} - {camp['name']}"
-        event['start']['date'] = start_date.strftime('%Y-%m-%d')
-        event['end']['date'] = event_end_date.strftime('%Y-%m-%d')
+        event['start']['date'] = start_date.date().isoformat()
+        event['end']['date'] = event_end_date.date().isoformat()
 
         # Update description
-        description_parts = [
-            f"Camp: {camp['name']}",
-            f"Session: {session['name']}",
-            f"Kid: {kid['name']}"
-        ]
-
-        if session.get('start_time') and session.get('end_time'):
-            description_parts.append(f"Time: {session['start_time']} - {session['end_time']}")
-
-        if session.get('cost'):
-            description_parts.append(f"Cost: ${session['cost']:.2f}")
-
-        if camp.get('phone'):
-            description_parts.append(f"Phone: {camp['phone']}")
-
-        if camp.get('website'):
-            description_parts.append(f"Website: {camp['website']}")
-
-        event['description'] = "\n".join(description_parts)
+        event['description'] = format_booking_description(kid, camp, session)
 
         # Update the event
-        service.events().update(calendarId='primary', eventId=calendar_event_id, body=event).execute()
+        execute_with_backoff(service.events().update(calendarId='primary', eventId=calendar_event_id, body=event))
         return True
 
     except Exception as e:
-        print(f"Error updating calendar event: {e}")
+        logger.exception("Calendar update_booking_event failed (%s)", classify_error(e))
         return False
 
 
@@ -274,9 +649,123 @@ def delete_booking_event(session_credentials, calendar_event_id):
     """
     try:
         service = get_calendar_service(session_credentials)
-        service.events().delete(calendarId='primary', eventId=calendar_event_id).execute()
+        execute_with_backoff(service.events().delete(calendarId='primary', eventId=calendar_event_id))
         return True
 
     except Exception as e:
-        print(f"Error deleting calendar event: {e}")
+        logger.exception("Calendar delete_booking_event failed (%s)", classify_error(e))
         return False
+
+
+def delete_booking_events_batch(session_credentials, calendar_event_ids):
+    """
+    Delete several booking calendar events in as few requests as possible.
+
+    Args:
+        session_credentials: OAuth credentials from session['credentials']
+        calendar_event_ids: List of event IDs to delete
+
+    Returns:
+        int: How many events were deleted
+
+    Why: Deleting a session can remove many booked weeks at once. The
+    batch endpoint sends up to 50 deletes in a single HTTP request.
+    """
+    if not calendar_event_ids:
+        return 0
+
+    try:
+        service = get_calendar_service(session_credentials)
+    except Exception as e:
+        logger.exception("Calendar delete_booking_events_batch failed (%s)", classify_error(e))
+        return 0
+
+    deleted = set()
+
+    def record_deletion(request_id, response, exception):
+        # Called once per event; request_id is the event's index as a string
+        if exception is None:
+            deleted.add(request_id)
+        elif classify_error(exception) == 'not_found':
+            # Already gone (e.g. a retried delete Google had already done)
+            deleted.add(request_id)
+        else:
+            logger.error("Calendar batch delete %s failed (%s): %s",
+                         request_id, classify_error(exception), exception)
+
+    execute_batch_with_backoff(
+        service,
+        {str(index): service.events().delete(calendarId='primary', eventId=calendar_event_id)
+         for index, calendar_event_id in enumerate(calendar_event_ids)},
+        record_deletion
+    )
+
+    return len(deleted)
+
+
+def run_in_background(func, *args, on_success=None):
+    """
+    Run a calendar function on the background executor.
+
+    Args:
+        func: The calendar function to call, e.g. delete_booking_event
+        *args: Arguments for func
+        on_success: Optional function called with func's return value
+                    once it finishes (runs on the background thread)
+
+    Returns:
+        Future: The submitted task
+
+    Why: Google Calendar calls take hundreds of milliseconds. Running them
+    in the background lets the page redirect without waiting for Google.
+    """
+    def report_result(future):
+        try:
+            result = future.result()
+            if on_success:
+                on_success(result)
+        except Exception as e:
+            logger.exception("Background calendar task %s failed (%s)",
+                             func.__name__, classify_error(e))
+
+    future = _calendar_executor.submit(func, *args)
+    future.add_done_callback(report_result)
+    return future
+
+
+def schedule_create_booking_events_batch(session_credentials, bookings, on_success=None):
+    """
+    Create booking events in the background (see create_booking_events_batch).
+
+    Args:
+        session_credentials: OAuth credentials from session['credentials']
+        bookings: List of booking detail dicts
+        on_success: Optional function called with the list of event IDs
+
+    Returns:
+        Future: The submitted task
+    """
+    # Copy the credentials so the background thread doesn't touch the session
+    return run_in_background(create_booking_events_batch, dict(session_credentials), bookings,
+                             on_success=on_success)
+
+
+def schedule_update_booking_event(session_credentials, calendar_event_id, parent, kid, camp, session, week):
+    """
+    Update a booking event in the background (see update_booking_event).
+
+    Returns:
+        Future: The submitted task
+    """
+    return run_in_background(update_booking_event, dict(session_credentials), calendar_event_id,
+                             parent, kid, camp, session, week)
+
+
+def schedule_delete_booking_event(session_credentials, calendar_event_id):
+    """
+    Delete a booking event in the background (see delete_booking_event).
+
+    Returns:
+        Future: The submitted task
+    """
+    return run_in_background(delete_booking_event, dict(session_credentials), calendar_event_id)
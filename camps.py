@@ -15,30 +15,78 @@ activities available for booking. Sessions belong to camps, so managing
 them together makes sense.
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, session, flash, current_app
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash, jsonify
 from auth import login_required, get_current_user
 from datastore_helpers import (
     get_datastore_client,
     create_entity,
+    build_entity,
+    create_entities,
     get_entity_for_user,
+    get_entities_for_user,
     update_entity,
     delete_entity,
+    delete_entities,
     query_by_user,
+    count_by_user,
+    session_counts_by_camp,
+    run_concurrently,
+    request_timestamp,
     entity_to_dict,
     entities_to_dict_list,
+    EntityView,
     # Kid access functions (for co-parent visibility)
     get_co_parent_emails
 )
-from calendar_integration import delete_booking_event
-from datetime import datetime, timedelta
+from calendar_integration import delete_booking_events_batch
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 import math
+import orjson
 import re
-import json
 from ai_parser import parse_session_url
+from form_helpers import parse_optional_date, parse_session_form
 
 # Create the blueprint
 camps_bp = Blueprint('camps', __name__, url_prefix='/camps')
 
+# Background threads for AI URL parsing, which takes 10-30 seconds per URL.
+# Running it here frees the web worker to serve other requests meanwhile.
+PARSE_WORKERS = 4
+parse_executor = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix='parse-url')
+
+# A parse job still pending after this long will never finish (e.g. the
+# instance running it was shut down), so parse_url_status reports it as
+# failed. Jobs older than this are also cleaned up when a new one starts.
+PARSE_JOB_TIMEOUT = timedelta(minutes=5)
+
+# App settings used by every route, copied from app.config once when the
+# blueprint is registered (see load_config) instead of on every request
+PROJECT_ID = None
+GCP_REGION = None
+GEMINI_MODEL = None
+
+
+@camps_bp.record_once
+def load_config(state):
+    """
+    Copy the settings this blueprint needs out of the app config.
+
+    Flask calls this once, when main.py registers the blueprint.
+    """
+    global PROJECT_ID, GCP_REGION, GEMINI_MODEL
+    PROJECT_ID = state.app.config['GCP_PROJECT_ID']
+    GCP_REGION = state.app.config['GCP_REGION']
+    GEMINI_MODEL = state.app.config['GEMINI_MODEL']
+
+# Number at the end of a session name (e.g. the "3" in "Week 3"), used to
+# suggest the next session's name. Compiled once when the module loads.
+TRAILING_NUMBER_PATTERN = re.compile(r'(\d+)$')
+
+# Days from each weekday (Monday=0 ... Sunday=6) to the following Monday.
+# A Monday maps to 7 so the next session never starts on the same day.
+DAYS_TO_NEXT_MONDAY = (7, 6, 5, 4, 3, 2, 1)
+
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -72,18 +120,74 @@ def calculate_duration_weeks(start_date, end_date):
 
     if start_weekday == 0 and end_weekday == 4:
         # Mon-Fri camp - count business days only
-        business_days = 0
-        current = start_date
-        while current <= end_date:
-            if current.weekday() < 5:  # Monday to Friday
-                business_days += 1
-            current += timedelta(days=1)
-        total_days = business_days
+        # Every full week has 5 weekdays. The leftover days start on a
+        # Monday, so the first 5 of them are weekdays.
+        full_weeks, leftover_days = divmod(total_days, 7)
+        total_days = full_weeks * 5 + min(leftover_days, 5)
 
     # Calculate weeks (5 days = 1 week, round up)
     return math.ceil(total_days / 5)
 
 
+def get_camps_with_session_counts(client, user_email):
+    """
+    Get a user's camps (sorted by name) and how many sessions each has.
+
+    Args:
+        client: datastore.Client instance
+        user_email: Email of the user who owns the camps
+
+    Returns:
+        Tuple of (list of Camp entities, Counter of camp_id -> session count)
+
+    Why: The camps list needs both for every co-parent. Wrapping the two
+    reads in one function lets camps_list load all co-parents at once
+    with run_concurrently.
+    """
+    camps = query_by_user(client, 'Camp', user_email, order_by='name')
+    return camps, session_counts_by_camp(client, user_email)
+
+
+def run_parse_job(job_id, url, project_id, region, model_name):
+    """
+    Parse a URL with AI and save the result on its ParseJob entity.
+
+    Runs on the parse_executor background threads (no Flask request).
+
+    Args:
+        job_id: ID of the ParseJob entity created by parse_url
+        url: The URL to parse
+        project_id: GCP project ID
+        region: GCP region for Vertex AI
+        model_name: Gemini model name
+    """
+    try:
+        result = parse_session_url(url, project_id, region, model_name)
+        state = 'done'
+    except Exception as e:
+        print(f"Error parsing URL {url}: {e}")
+        result = {'success': False, 'error': str(e)}
+        state = 'error'
+
+    # Nothing is waiting on this thread's Future, so an uncaught error here
+    # would vanish and leave the browser polling a job that never finishes
+    try:
+        client = get_datastore_client(project_id)
+        job = client.get(client.key('ParseJob', job_id))
+        if job:
+            update_entity(client, job, {'state': state, 'result': orjson.dumps(result).decode()})
+    except Exception as e:
+        print(f"Error saving parse job {job_id} for {url}: {e}")
+        try:
+            error_result = {'success': False, 'error': 'Could not save the parse result. Please try again.'}
+            client = get_datastore_client(project_id)
+            job = client.get(client.key('ParseJob', job_id))
+            if job:
+                update_entity(client, job, {'state': 'error', 'result': orjson.dumps(error_result).decode()})
+        except Exception as e:
+            print(f"Error marking parse job {job_id} as failed: {e}")
+
+
 # ============================================================================
 # CAMP ROUTES
 # ============================================================================
@@ -98,44 +202,36 @@ def camps_list():
     from co-parents (for booking shared kids). User can only edit their own camps.
     """
     user = get_current_user()
-    client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
+    client = get_datastore_client(PROJECT_ID)
 
-    # Get co-parent emails for looking up their camps
-    co_parent_emails = get_co_parent_emails(client, user['email'])
+    # Get co-parent emails (for looking up their camps), this user's camps,
+    # and this user's session counts per camp (one query for all camps).
+    # These reads are independent, so they run at the same time.
+    co_parent_emails, own_camps, session_counts = run_concurrently([
+        (get_co_parent_emails, client, user['email']),
+        (query_by_user, client, 'Camp', user['email'], 'name'),
+        (session_counts_by_camp, client, user['email']),
+    ])
 
-    # Query all camps for this user
-    own_camps = query_by_user(client, 'Camp', user['email'], order_by='name')
-
-    # For each owned camp, get the count of sessions
     camps_with_counts = []
     for camp in own_camps:
-        camp_dict = entity_to_dict(camp)
+        camp_dict = EntityView(camp)
         camp_dict['is_owner'] = True
-        # Query sessions for this camp
-        sessions = query_by_user(
-            client,
-            'Session',
-            user['email'],
-            filters=[('camp_id', '=', camp.key.name)]
-        )
-        camp_dict['session_count'] = len(sessions)
+        camp_dict['session_count'] = session_counts.get(camp.key.name, 0)
         camps_with_counts.append(camp_dict)
 
-    # Add camps from co-parents (read-only)
-    for co_parent_email in co_parent_emails:
-        co_parent_camps = query_by_user(client, 'Camp', co_parent_email, order_by='name')
+    # Add camps from co-parents (read-only), loading every co-parent's
+    # camps at the same time
+    co_parent_emails = list(co_parent_emails)
+    co_parent_results = run_concurrently([
+        (get_camps_with_session_counts, client, email) for email in co_parent_emails
+    ])
+    for co_parent_email, (co_parent_camps, co_parent_session_counts) in zip(co_parent_emails, co_parent_results):
         for camp in co_parent_camps:
-            camp_dict = entity_to_dict(camp)
+            camp_dict = EntityView(camp)
             camp_dict['is_owner'] = False
             camp_dict['owner_email'] = co_parent_email
-            # Query sessions for this camp
-            sessions = query_by_user(
-                client,
-                'Session',
-                co_parent_email,
-                filters=[('camp_id', '=', camp.key.name)]
-            )
-            camp_dict['session_count'] = len(sessions)
+            camp_dict['session_count'] = co_parent_session_counts.get(camp.key.name, 0)
             camps_with_counts.append(camp_dict)
 
     # Sort all camps by name
@@ -159,7 +255,7 @@ def camp_new():
     user = get_current_user()
 
     if request.method == 'POST':
-        client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
+        client = get_datastore_client(PROJECT_ID)
 
         # Create the camp entity
         camp = create_entity(
@@ -190,7 +286,7 @@ def camp_view(id):
     Why: Users need to update camp contact info and manage sessions.
     """
     user = get_current_user()
-    client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
+    client = get_datastore_client(PROJECT_ID)
 
     # Get the camp and verify ownership
     camp = get_entity_for_user(client, 'Camp', id, user['email'])
@@ -207,11 +303,15 @@ def camp_view(id):
         filters=[('camp_id', '=', id)]
     )
 
-    # Convert to dict list and sort by start date (then alphabetically by name)
+    # Sort by start date (undated sessions last), then alphabetically by
+    # name regardless of case. This is done here rather than in Datastore,
+    # which sorts missing dates first, compares names case-sensitively,
+    # and skips sessions that have no start date property at all.
     sessions_list = entities_to_dict_list(sessions)
     sessions_list.sort(key=lambda s: (
-        s.get('session_start_date') if s.get('session_start_date') else datetime.max,
-        s.get('name', '').lower()
+        not s.get('session_start_date'),
+        s.get('session_start_date') or '',
+        (s.get('name') or '').lower()
     ))
 
     return render_template(
@@ -231,7 +331,7 @@ def camp_update(id):
     Why: Contact info changes over time.
     """
     user = get_current_user()
-    client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
+    client = get_datastore_client(PROJECT_ID)
 
     # Get the camp and verify ownership
     camp = get_entity_for_user(client, 'Camp', id, user['email'])
@@ -268,7 +368,7 @@ def camp_delete(id):
     For now, users should delete sessions first.
     """
     user = get_current_user()
-    client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
+    client = get_datastore_client(PROJECT_ID)
 
     # Get the camp and verify ownership
     camp = get_entity_for_user(client, 'Camp', id, user['email'])
@@ -278,15 +378,15 @@ def camp_delete(id):
         return redirect(url_for('camps.camps_list'))
 
     # Check if camp has sessions
-    sessions = query_by_user(
+    session_count = count_by_user(
         client,
         'Session',
         user['email'],
         filters=[('camp_id', '=', id)]
     )
 
-    if sessions:
-        flash(f"Cannot delete camp '{camp['name']}' because it has {len(sessions)} session(s). Delete sessions first.", 'error')
+    if session_count:
+        flash(f"Cannot delete camp '{camp['name']}' because it has {session_count} session(s). Delete sessions first.", 'error')
         return redirect(url_for('camps.camp_view', id=id))
 
     name = camp['name']
@@ -309,7 +409,7 @@ def session_new(camp_id):
     Why: Sessions are the bookable units within a camp.
     """
     user = get_current_user()
-    client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
+    client = get_datastore_client(PROJECT_ID)
 
     # Get the camp and verify ownership
     camp = get_entity_for_user(client, 'Camp', camp_id, user['email'])
@@ -319,29 +419,6 @@ def session_new(camp_id):
         return redirect(url_for('camps.camps_list'))
 
     if request.method == 'POST':
-        # Parse optional integer fields
-        age_min = int(request.form['age_min']) if request.form.get('age_min') else None
-        age_max = int(request.form['age_max']) if request.form.get('age_max') else None
-        grade_min = int(request.form['grade_min']) if request.form.get('grade_min') else None
-        grade_max = int(request.form['grade_max']) if request.form.get('grade_max') else None
-        cost = float(request.form['cost']) if request.form.get('cost') else None
-        early_care_cost = float(request.form['early_care_cost']) if request.form.get('early_care_cost') else None
-        late_care_cost = float(request.form['late_care_cost']) if request.form.get('late_care_cost') else None
-
-        # Parse registration date
-        registration_open_date = None
-        if request.form.get('registration_open_date') and request.form.get('registration_open_time'):
-            registration_datetime_str = f"{request.form['registration_open_date']} {request.form['registration_open_time']}"
-            registration_open_date = datetime.strptime(registration_datetime_str, '%Y-%m-%d %H:%M')
-
-        # Parse session date range
-        session_start_date = None
-        session_end_date = None
-        if request.form.get('session_start_date'):
-            session_start_date = datetime.strptime(request.form['session_start_date'], '%Y-%m-%d')
-        if request.form.get('session_end_date'):
-            session_end_date = datetime.strptime(request.form['session_end_date'], '%Y-%m-%d')
-
         # Create the session entity
         session_entity = create_entity(
             client,
@@ -349,28 +426,8 @@ def session_new(camp_id):
             user['email'],
             {
                 'camp_id': camp_id,
-                'name': request.form['name'],
-                'age_min': age_min,
-                'age_max': age_max,
-                'grade_min': grade_min,
-                'grade_max': grade_max,
-                'duration_weeks': int(request.form.get('duration_weeks', 1)),
-                'session_start_date': session_start_date,
-                'session_end_date': session_end_date,
                 'holidays': [],  # TODO: Add holiday input in Phase 2
-                'start_time': request.form.get('start_time', ''),
-                'end_time': request.form.get('end_time', ''),
-                'dropoff_window_start': request.form.get('dropoff_window_start', ''),
-                'dropoff_window_end': request.form.get('dropoff_window_end', ''),
-                'pickup_window_start': request.form.get('pickup_window_start', ''),
-                'pickup_window_end': request.form.get('pickup_window_end', ''),
-                'url': request.form.get('url', ''),
-                'cost': cost,
-                'early_care_available': 'early_care_available' in request.form,
-                'early_care_cost': early_care_cost,
-                'late_care_available': 'late_care_available' in request.form,
-                'late_care_cost': late_care_cost,
-                'registration_open_date': registration_open_date
+                **parse_session_form(request.form)
             }
         )
 
@@ -384,7 +441,8 @@ def session_new(camp_id):
         'Session',
         user['email'],
         filters=[('camp_id', '=', camp_id)],
-        order_by='-updated_at'
+        order_by='-updated_at',
+        limit=1  # only the most recently modified session is used
     )
 
     # Calculate smart defaults based on most recently modified session
@@ -394,24 +452,21 @@ def session_new(camp_id):
 
         # 1. Auto-increment session name if it ends with a number
         prev_name = prev_session.get('name', '')
-        match = re.search(r'^(.+?)(\d+)$', prev_name)
+        match = TRAILING_NUMBER_PATTERN.search(prev_name)
         if match:
-            name_base = match.group(1)
-            number = int(match.group(2))
+            name_base = prev_name[:match.start()]
+            number = int(match.group(1))
             defaults['name'] = f"{name_base}{number + 1}"
         else:
             defaults['name'] = prev_name
 
         # 2. Calculate start date as Monday after previous session's end date
-        if prev_session.get('session_end_date'):
-            prev_end = prev_session['session_end_date']
-            # Convert to datetime if it's a string
-            if isinstance(prev_end, str):
-                prev_end = datetime.strptime(prev_end, '%Y-%m-%d')
+        # Read it from the entity itself, where Datastore gives us a datetime
+        # (entity_to_dict turns dates into strings for the form)
+        prev_end = existing_sessions[0].get('session_end_date')
+        if prev_end:
             # Find the next Monday after the previous session's end date
-            days_until_monday = (7 - prev_end.weekday()) % 7
-            if days_until_monday == 0:
-                days_until_monday = 7
+            days_until_monday = DAYS_TO_NEXT_MONDAY[prev_end.weekday()]
             defaults['session_start_date'] = prev_end + timedelta(days=days_until_monday)
 
         # 3. Copy duration_weeks (default to 1 if not set)
@@ -479,17 +534,28 @@ def session_view(id):
     Why: Session details (times, costs, registration dates) change.
     """
     user = get_current_user()
-    client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
+    client = get_datastore_client(PROJECT_ID)
 
-    # Get the session and verify ownership
-    session_entity = get_entity_for_user(client, 'Session', id, user['email'])
+    # Links from the camp page include camp_id, so the session and its camp
+    # can be fetched together in one Datastore request
+    camp_id_hint = request.args.get('camp_id')
+    if camp_id_hint:
+        session_entity, camp = get_entities_for_user(
+            client,
+            [('Session', id), ('Camp', camp_id_hint)],
+            user['email']
+        )
+    else:
+        session_entity = get_entity_for_user(client, 'Session', id, user['email'])
+        camp = None
 
     if not session_entity:
         flash('Session not found or access denied.', 'error')
         return redirect(url_for('camps.camps_list'))
 
-    # Get the parent camp
-    camp = get_entity_for_user(client, 'Camp', session_entity['camp_id'], user['email'])
+    # Get the parent camp (unless the hint already fetched the right one)
+    if not camp or camp.key.name != session_entity['camp_id']:
+        camp = get_entity_for_user(client, 'Camp', session_entity['camp_id'], user['email'])
 
     if not camp:
         flash('Parent camp not found.', 'error')
@@ -498,8 +564,8 @@ def session_view(id):
     return render_template(
         'session_form.html',
         user=user,
-        camp=entity_to_dict(camp),
-        session=entity_to_dict(session_entity),
+        camp=EntityView(camp),
+        session=EntityView(session_entity),
         defaults={}
     )
 
@@ -513,7 +579,7 @@ def session_update(id):
     Why: Session details change frequently (times, costs, registration dates).
     """
     user = get_current_user()
-    client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
+    client = get_datastore_client(PROJECT_ID)
 
     # Get the session and verify ownership
     session_entity = get_entity_for_user(client, 'Session', id, user['email'])
@@ -522,57 +588,8 @@ def session_update(id):
         flash('Session not found or access denied.', 'error')
         return redirect(url_for('camps.camps_list'))
 
-    # Parse optional integer fields
-    age_min = int(request.form['age_min']) if request.form.get('age_min') else None
-    age_max = int(request.form['age_max']) if request.form.get('age_max') else None
-    grade_min = int(request.form['grade_min']) if request.form.get('grade_min') else None
-    grade_max = int(request.form['grade_max']) if request.form.get('grade_max') else None
-    cost = float(request.form['cost']) if request.form.get('cost') else None
-    early_care_cost = float(request.form['early_care_cost']) if request.form.get('early_care_cost') else None
-    late_care_cost = float(request.form['late_care_cost']) if request.form.get('late_care_cost') else None
-
-    # Parse registration date
-    registration_open_date = None
-    if request.form.get('registration_open_date') and request.form.get('registration_open_time'):
-        registration_datetime_str = f"{request.form['registration_open_date']} {request.form['registration_open_time']}"
-        registration_open_date = datetime.strptime(registration_datetime_str, '%Y-%m-%d %H:%M')
-
-    # Parse session date range
-    session_start_date = None
-    session_end_date = None
-    if request.form.get('session_start_date'):
-        session_start_date = datetime.strptime(request.form['session_start_date'], '%Y-%m-%d')
-    if request.form.get('session_end_date'):
-        session_end_date = datetime.strptime(request.form['session_end_date'], '%Y-%m-%d')
-
     # Update the session
-    update_entity(
-        client,
-        session_entity,
-        {
-            'name': request.form['name'],
-            'age_min': age_min,
-            'age_max': age_max,
-            'grade_min': grade_min,
-            'grade_max': grade_max,
-            'duration_weeks': int(request.form.get('duration_weeks', 1)),
-            'session_start_date': session_start_date,
-            'session_end_date': session_end_date,
-            'start_time': request.form.get('start_time', ''),
-            'end_time': request.form.get('end_time', ''),
-            'dropoff_window_start': request.form.get('dropoff_window_start', ''),
-            'dropoff_window_end': request.form.get('dropoff_window_end', ''),
-            'pickup_window_start': request.form.get('pickup_window_start', ''),
-            'pickup_window_end': request.form.get('pickup_window_end', ''),
-            'url': request.form.get('url', ''),
-            'cost': cost,
-            'early_care_available': 'early_care_available' in request.form,
-            'early_care_cost': early_care_cost,
-            'late_care_available': 'late_care_available' in request.form,
-            'late_care_cost': late_care_cost,
-            'registration_open_date': registration_open_date
-        }
-    )
+    update_entity(client, session_entity, parse_session_form(request.form))
 
     flash(f"Session '{request.form['name']}' updated successfully!", 'success')
     return redirect(url_for('camps.camp_view', id=session_entity['camp_id']))
@@ -590,7 +607,7 @@ def session_delete(id):
     Requires confirmation if bookings exist.
     """
     user = get_current_user()
-    client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
+    client = get_datastore_client(PROJECT_ID)
 
     # Get the session and verify ownership
     session_entity = get_entity_for_user(client, 'Session', id, user['email'])
@@ -602,65 +619,70 @@ def session_delete(id):
     camp_id = session_entity['camp_id']
     name = session_entity['name']
 
-    # Check for bookings associated with this session
-    bookings = query_by_user(
-        client,
-        'Booking',
-        user['email'],
-        filters=[('session_id', '=', id)]
-    )
-
     # If bookings exist and user hasn't confirmed, require confirmation
     confirmed = request.args.get('confirm') == '1' or request.form.get('confirm') == '1'
+    booking_filters = [('session_id', '=', id)]
 
-    if bookings and not confirmed:
-        booking_count = len(bookings)
-        booked_count = sum(1 for b in bookings if b.get('state') == 'booked')
+    if confirmed:
+        # Load the bookings we're about to delete
+        bookings = query_by_user(client, 'Booking', user['email'], filters=booking_filters)
+    else:
+        # The confirmation page only needs counts, so let Datastore count
+        booking_count = count_by_user(client, 'Booking', user['email'], filters=booking_filters)
 
-        if booked_count > 0:
-            flash(
-                f"Warning: This session has {booking_count} booking(s), including {booked_count} confirmed booking(s). "
-                f"Deleting this session will also delete all associated bookings and calendar events. "
-                f"Please confirm you want to proceed.",
-                'warning'
+        if booking_count:
+            booked_count = count_by_user(
+                client,
+                'Booking',
+                user['email'],
+                filters=booking_filters + [('state', '=', 'booked')]
             )
-        else:
-            flash(
-                f"Warning: This session has {booking_count} booking(s). "
-                f"Deleting this session will also delete all associated bookings. "
-                f"Please confirm you want to proceed.",
-                'warning'
+
+            if booked_count > 0:
+                flash(
+                    f"Warning: This session has {booking_count} booking(s), including {booked_count} confirmed booking(s). "
+                    f"Deleting this session will also delete all associated bookings and calendar events. "
+                    f"Please confirm you want to proceed.",
+                    'warning'
+                )
+            else:
+                flash(
+                    f"Warning: This session has {booking_count} booking(s). "
+                    f"Deleting this session will also delete all associated bookings. "
+                    f"Please confirm you want to proceed.",
+                    'warning'
+                )
+
+            # Redirect back with confirmation parameter
+            return render_template(
+                'confirm_session_delete.html',
+                user=user,
+                session=entity_to_dict(session_entity),
+                camp_id=camp_id,
+                booking_count=booking_count,
+                booked_count=booked_count
             )
 
-        # Redirect back with confirmation parameter
-        return render_template(
-            'confirm_session_delete.html',
-            user=user,
-            session=entity_to_dict(session_entity),
-            camp_id=camp_id,
-            booking_count=booking_count,
-            booked_count=booked_count
-        )
+        # No bookings, so there's nothing to load or confirm
+        bookings = []
 
-    # Delete all associated bookings and their calendar events
-    bookings_deleted = 0
+    # Delete calendar events for 'booked' bookings, all in one batch request
+    calendar_event_ids = [
+        booking['calendar_event_id']
+        for booking in bookings
+        if booking.get('state') == 'booked' and booking.get('calendar_event_id')
+    ]
     calendar_events_deleted = 0
+    if 'credentials' in session:
+        calendar_events_deleted = delete_booking_events_batch(session['credentials'], calendar_event_ids)
 
-    for booking in bookings:
-        try:
-            # If booking is 'booked' and has a calendar event, delete it
-            if booking.get('state') == 'booked' and booking.get('calendar_event_id') and 'credentials' in session:
-                try:
-                    success = delete_booking_event(session['credentials'], booking['calendar_event_id'])
-                    if success:
-                        calendar_events_deleted += 1
-                except Exception as e:
-                    print(f"Error deleting calendar event {booking['calendar_event_id']}: {e}")
-
-            delete_entity(client, booking)
-            bookings_deleted += 1
-        except Exception as e:
-            print(f"Error deleting booking {booking.key.name}: {e}")
+    # Delete all associated bookings with one Datastore request
+    bookings_deleted = 0
+    try:
+        delete_entities(client, bookings)
+        bookings_deleted = len(bookings)
+    except Exception as e:
+        print(f"Error deleting bookings for session {id}: {e}")
 
     # Now delete the session
     delete_entity(client, session_entity)
@@ -685,45 +707,110 @@ def session_delete(id):
 @login_required
 def parse_url():
     """
-    Parse a camp/session URL using AI to extract structured data.
-    
+    Start parsing a camp/session URL using AI to extract structured data.
+
     This endpoint uses Google Gemini to intelligently extract camp and session
     information from website URLs, including multi-level link following and
-    stale data detection.
-    
+    stale data detection. Parsing takes 10-30 seconds, so it runs in the
+    background and the browser polls parse_url_status for the result.
+
     Expects JSON body with:
         - url: The URL to parse
-        
+
     Returns:
-        JSON with extracted data and staleness warnings
+        JSON with the job_id to poll (202 Accepted)
     """
     user = get_current_user()
-    
+
     try:
         # Get URL from request
         data = request.get_json()
         url = data.get('url')
-        
+
         if not url:
-            return json.dumps({'success': False, 'error': 'URL is required'}), 400
-        
-        # Parse the URL using AI
-        result = parse_session_url(
+            return jsonify({'success': False, 'error': 'URL is required'}), 400
+
+        client = get_datastore_client(PROJECT_ID)
+
+        # Jobs are normally deleted when the browser collects the result.
+        # Remove any it never collected (e.g. the tab was closed mid-parse)
+        # so they don't pile up in Datastore.
+        abandoned_jobs = query_by_user(
+            client,
+            'ParseJob',
+            user['email'],
+            filters=[('created_at', '<', request_timestamp() - PARSE_JOB_TIMEOUT)],
+            keys_only=True
+        )
+        delete_entities(client, abandoned_jobs)
+
+        # Save a job record so any instance can answer the status polls
+        job = build_entity(client, 'ParseJob', user['email'], {
+            'url': url,
+            'state': 'pending',
+            'result': None
+        })
+        # The result can be far longer than Datastore's indexed-string limit
+        job.exclude_from_indexes.add('result')
+        client.put(job)
+
+        # Parse the URL using AI in the background
+        parse_executor.submit(
+            run_parse_job,
+            job.key.name,
             url,
-            current_app.config['GCP_PROJECT_ID'],
-            current_app.config['GCP_REGION'],
-            current_app.config['GEMINI_MODEL']
+            PROJECT_ID,
+            GCP_REGION,
+            GEMINI_MODEL
         )
-        
-        return json.dumps(result), 200
-        
+
+        return jsonify({'success': True, 'job_id': job.key.name}), 202
+
     except Exception as e:
-        return json.dumps({
+        return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
+@camps_bp.route('/parse-url/<job_id>', methods=['GET'])
+@login_required
+def parse_url_status(job_id):
+    """
+    Check on a URL parsing job started by parse_url.
+
+    Returns:
+        JSON with status 'pending' while the job runs. Once it finishes,
+        returns the parse result (the same shape parse_session_url returns)
+        and deletes the job record. A job that has been pending for longer
+        than PARSE_JOB_TIMEOUT is reported as an error and deleted.
+    """
+    user = get_current_user()
+    client = get_datastore_client(PROJECT_ID)
+
+    job = get_entity_for_user(client, 'ParseJob', job_id, user['email'])
+    if not job:
+        return jsonify({'success': False, 'error': 'Parse job not found'}), 404
+
+    if job['state'] == 'pending':
+        if job['created_at'] > request_timestamp() - PARSE_JOB_TIMEOUT:
+            return jsonify({'success': True, 'status': 'pending'}), 200
+
+        # The background thread was lost, so stop the browser polling forever
+        delete_entity(client, job)
+        return jsonify({
+            'success': False,
+            'error': 'Parsing took too long. Please try again.',
+            'status': 'error'
+        }), 200
+
+    # The browser only fetches the result once, so clean up the job
+    result = orjson.loads(job['result'])
+    delete_entity(client, job)
+
+    return jsonify({**result, 'status': job['state']}), 200
+
+
 @camps_bp.route('/<camp_id>/sessions/bulk', methods=['POST'])
 @login_required
 def session_bulk_create(camp_id):
@@ -741,24 +828,23 @@ def session_bulk_create(camp_id):
         JSON with success status and count of created sessions
     """
     user = get_current_user()
-    client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
+    client = get_datastore_client(PROJECT_ID)
     
     try:
         # Verify camp exists and user has access
         camp = get_entity_for_user(client, 'Camp', camp_id, user['email'])
         if not camp:
-            return json.dumps({'success': False, 'error': 'Camp not found or access denied'}), 404
+            return jsonify({'success': False, 'error': 'Camp not found or access denied'}), 404
         
         # Get sessions from request
         data = request.get_json()
         sessions = data.get('sessions', [])
         
         if not sessions:
-            return json.dumps({'success': False, 'error': 'No sessions provided'}), 400
+            return jsonify({'success': False, 'error': 'No sessions provided'}), 400
         
-        created_count = 0
-        
-        # Create each session
+        # Gather every session's properties first, then save them all in one batch
+        new_sessions = []
         for session_data in sessions:
             # Parse optional integer fields
             age_min = session_data.get('age_min')
@@ -769,36 +855,10 @@ def session_bulk_create(camp_id):
             early_care_cost = session_data.get('early_care_cost')
             late_care_cost = session_data.get('late_care_cost')
             
-            # Parse registration date
-            registration_open_date = None
-            if session_data.get('registration_open_date'):
-                try:
-                    registration_open_date = datetime.strptime(
-                        session_data['registration_open_date'], 
-                        '%Y-%m-%d'
-                    )
-                except ValueError:
-                    pass
-            
-            # Parse session date range
-            session_start_date = None
-            session_end_date = None
-            if session_data.get('session_start_date'):
-                try:
-                    session_start_date = datetime.strptime(
-                        session_data['session_start_date'],
-                        '%Y-%m-%d'
-                    )
-                except ValueError:
-                    pass
-            if session_data.get('session_end_date'):
-                try:
-                    session_end_date = datetime.strptime(
-                        session_data['session_end_date'],
-                        '%Y-%m-%d'
-                    )
-                except ValueError:
-                    pass
+            # Parse registration date and session date range
+            registration_open_date = parse_optional_date(session_data.get('registration_open_date'))
+            session_start_date = parse_optional_date(session_data.get('session_start_date'))
+            session_end_date = parse_optional_date(session_data.get('session_end_date'))
 
             # Calculate duration_weeks from dates if available
             if session_start_date and session_end_date:
@@ -806,46 +866,42 @@ def session_bulk_create(camp_id):
             else:
                 duration_weeks = session_data.get('duration_weeks', 1)
 
-            # Create the session entity
-            create_entity(
-                client,
-                'Session',
-                user['email'],
-                {
-                    'camp_id': camp_id,
-                    'name': session_data.get('name', 'Unnamed Session'),
-                    'age_min': age_min,
-                    'age_max': age_max,
-                    'grade_min': grade_min,
-                    'grade_max': grade_max,
-                    'duration_weeks': duration_weeks,
-                    'session_start_date': session_start_date,
-                    'session_end_date': session_end_date,
-                    'holidays': [],
-                    'start_time': session_data.get('start_time', ''),
-                    'end_time': session_data.get('end_time', ''),
-                    'dropoff_window_start': session_data.get('dropoff_window_start', ''),
-                    'dropoff_window_end': session_data.get('dropoff_window_end', ''),
-                    'pickup_window_start': session_data.get('pickup_window_start', ''),
-                    'pickup_window_end': session_data.get('pickup_window_end', ''),
-                    'url': session_data.get('url', ''),
-                    'cost': cost,
-                    'early_care_available': session_data.get('early_care_available', False),
-                    'early_care_cost': early_care_cost,
-                    'late_care_available': session_data.get('late_care_available', False),
-                    'late_care_cost': late_care_cost,
-                    'registration_open_date': registration_open_date
-                }
-            )
-            created_count += 1
-        
-        return json.dumps({
+            # Session properties (saved below)
+            new_sessions.append({
+                'camp_id': camp_id,
+                'name': session_data.get('name', 'Unnamed Session'),
+                'age_min': age_min,
+                'age_max': age_max,
+                'grade_min': grade_min,
+                'grade_max': grade_max,
+                'duration_weeks': duration_weeks,
+                'session_start_date': session_start_date,
+                'session_end_date': session_end_date,
+                'holidays': [],
+                'start_time': session_data.get('start_time', ''),
+                'end_time': session_data.get('end_time', ''),
+                'dropoff_window_start': session_data.get('dropoff_window_start', ''),
+                'dropoff_window_end': session_data.get('dropoff_window_end', ''),
+                'pickup_window_start': session_data.get('pickup_window_start', ''),
+                'pickup_window_end': session_data.get('pickup_window_end', ''),
+                'url': session_data.get('url', ''),
+                'cost': cost,
+                'early_care_available': session_data.get('early_care_available', False),
+                'early_care_cost': early_care_cost,
+                'late_care_available': session_data.get('late_care_available', False),
+                'late_care_cost': late_care_cost,
+                'registration_open_date': registration_open_date
+            })
+
+        create_entities(client, 'Session', user['email'], new_sessions)
+
+        return jsonify({
             'success': True,
-            'created': created_count
+            'created': len(new_sessions)
         }), 200
         
     except Exception as e:
-        return json.dumps({
+        return jsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -14,14 +14,52 @@ unauthorized access). Centralizing these patterns makes the code more
 maintainable and helps beginning engineers learn the correct approach.
 """
 
+from google.api_core.exceptions import BadRequest
 from google.cloud import datastore
+from google.cloud.datastore.query import PropertyFilter
+from flask import g, has_app_context
+from collections import Counter
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+import threading
 import uuid
 
 
+# Maximum number of keys Datastore accepts in one batch operation
+DATASTORE_BATCH_LIMIT = 500
+
+# One Datastore client per project for the life of the process
+# (the client is thread-safe, so all requests can share it)
+_datastore_clients = {}
+_datastore_clients_lock = threading.Lock()
+
+# Threads shared by all requests for running independent Datastore reads
+# at the same time (see run_concurrently). Created once per process so
+# requests don't pay to start new threads.
+DATASTORE_READ_WORKERS = 10
+_datastore_read_executor = ThreadPoolExecutor(max_workers=DATASTORE_READ_WORKERS)
+
+# Properties that hold datetimes, for each kind entity_to_dict converts.
+# Only these need formatting, so the other properties are copied as-is.
+# Kinds missing from this table fall back to checking every property.
+TIMESTAMP_FIELDS = ('created_at', 'updated_at')
+DATETIME_FIELDS = {
+    'Parent': TIMESTAMP_FIELDS,
+    'Kid': TIMESTAMP_FIELDS + ('birthday', 'last_day_of_school', 'first_day_of_school'),
+    'Camp': TIMESTAMP_FIELDS,
+    'Session': TIMESTAMP_FIELDS + ('session_start_date', 'session_end_date', 'registration_open_date'),
+    'Week': TIMESTAMP_FIELDS + ('start_date', 'end_date'),
+    'Trip': TIMESTAMP_FIELDS + ('start_date', 'end_date'),
+    'Booking': TIMESTAMP_FIELDS,
+    'ShareToken': TIMESTAMP_FIELDS,
+    'KidAccess': TIMESTAMP_FIELDS,
+}
+
+
 def get_datastore_client(project_id):
     """
-    Create and return a Cloud Datastore client.
+    Return the shared Cloud Datastore client for a project.
 
     Args:
         project_id: GCP project ID
@@ -30,13 +68,46 @@ def get_datastore_client(project_id):
         datastore.Client instance
 
     Why: Centralized client creation ensures consistent configuration.
+    Creating a client looks up credentials and opens network connections,
+    so we create it once per process and let every request reuse it.
+
+    The client is safe to share between threads. Each gunicorn worker
+    process builds its own on first use; nothing is shared across processes.
+    """
+    client = _datastore_clients.get(project_id)
+    if client is None:
+        with _datastore_clients_lock:
+            # Check again in case another thread created it while we waited
+            client = _datastore_clients.get(project_id)
+            if client is None:
+                client = datastore.Client(project=project_id)
+                _datastore_clients[project_id] = client
+    return client
+
+
+def request_timestamp():
     """
-    return datastore.Client(project=project_id)
+    Return the UTC time to stamp on entities saved during this request.
 
+    Returns:
+        datetime: Timezone-aware UTC time. Inside a request, the same value
+        is returned every time; outside one, the current time.
 
-def create_entity(client, kind, user_email, properties):
+    Why: Everything a single request creates or updates happened "at the
+    same time" from the user's point of view, so one timestamp (kept on
+    flask.g) is enough. It also saves reading the clock once per entity on
+    bulk paths like week generation.
     """
-    Create a new Datastore entity with automatic timestamps and UUID key.
+    if not has_app_context():
+        return datetime.now(timezone.utc)
+    if 'request_timestamp' not in g:
+        g.request_timestamp = datetime.now(timezone.utc)
+    return g.request_timestamp
+
+
+def build_entity(client, kind, user_email, properties):
+    """
+    Build a new Datastore entity with timestamps and UUID key, without saving it.
 
     Args:
         client: datastore.Client instance
@@ -45,13 +116,11 @@ def create_entity(client, kind, user_email, properties):
         properties: Dictionary of entity properties
 
     Returns:
-        The created entity with key, timestamps, and user_email
+        The new (unsaved) entity with key, timestamps, and user_email
 
-    Why: Every entity needs:
-    - UUID key (simple, secure, no collisions)
-    - user_email (isolate data by user)
-    - created_at and updated_at (audit trail)
-    This function ensures we never forget these critical properties.
+    Why: Lets callers create many entities and save them together with
+    put_entities. create_entity uses this too, so both paths always set
+    the same critical properties.
     """
     # Generate a unique ID for this entity
     entity_id = str(uuid.uuid4())
@@ -66,17 +135,113 @@ def create_entity(client, kind, user_email, properties):
     entity['user_email'] = user_email
 
     # Add timestamps (UTC timezone-aware for Datastore compatibility)
-    now = datetime.now(timezone.utc)
+    now = request_timestamp()
     entity['created_at'] = now
     entity['updated_at'] = now
 
     # Add all the custom properties
     entity.update(properties)
 
+    return entity
+
+
+def put_entities(client, entities):
+    """
+    Save several entities to Datastore in batched requests.
+
+    Args:
+        client: datastore.Client instance
+        entities: List of entities (e.g., from build_entity)
+
+    Why: Saving one at a time costs a round trip per entity. put_multi
+    saves up to 500 entities (Datastore's batch limit) in one request.
+    """
+    for start in range(0, len(entities), DATASTORE_BATCH_LIMIT):
+        client.put_multi(entities[start:start + DATASTORE_BATCH_LIMIT])
+
+
+def create_entity(client, kind, user_email, properties):
+    """
+    Create a new Datastore entity with automatic timestamps and UUID key.
+
+    Args:
+        client: datastore.Client instance
+        kind: Entity kind (e.g., 'Kid', 'Camp', 'Session')
+        user_email: Email of the authenticated user (for ownership)
+        properties: Dictionary of entity properties
+
+    Returns:
+        The created entity with key, timestamps, and user_email
+
+    Why: Every entity needs:
+    - UUID key (simple, secure, no collisions)
+    - user_email (isolate data by user)
+    - created_at and updated_at (audit trail)
+    This function ensures we never forget these critical properties.
+    """
+    return create_entities(client, kind, user_email, [properties])[0]
+
+
+def create_entities(client, kind, user_email, properties_list):
+    """
+    Create several Datastore entities of one kind and save them together.
+
+    Args:
+        client: datastore.Client instance
+        kind: Entity kind (e.g., 'Week', 'Session')
+        user_email: Email of the authenticated user (for ownership)
+        properties_list: List of property dictionaries, one per entity
+
+    Returns:
+        List of the created entities, in the same order as properties_list
+
+    Why: Same as create_entity (UUID key, user_email, timestamps), but all
+    the entities are saved with put_multi, so creating N entities costs
+    one round trip instead of N.
+    """
+    entities = [build_entity(client, kind, user_email, properties) for properties in properties_list]
+
     # Save to Datastore
-    client.put(entity)
+    put_entities(client, entities)
 
-    return entity
+    return entities
+
+
+def get_request_entity_cache():
+    """
+    Return this request's entity cache, or None outside a request.
+
+    Returns:
+        Dict mapping (kind, entity_id) to an entity fetched during this
+        request, or None when there is no Flask app context (for example,
+        in a background thread)
+
+    Why: Some pages look up the same camp or session more than once. Keeping
+    what we fetched on flask.g (which only lives for one request) means the
+    second lookup doesn't need another Datastore round trip, and no entity
+    is ever reused across requests or users.
+    """
+    if not has_app_context():
+        return None
+    if 'entity_cache' not in g:
+        g.entity_cache = {}
+    return g.entity_cache
+
+
+def forget_cached_entities(keys):
+    """
+    Remove entities from this request's entity cache.
+
+    Args:
+        keys: Datastore keys of entities that were changed or deleted
+
+    Why: After an update or delete, a later lookup in the same request
+    must see the new state, not the copy we cached earlier.
+    """
+    cache = get_request_entity_cache()
+    if cache:
+        for key in keys:
+            cache.pop((key.kind, key.id_or_name), None)
 
 
 def get_entity_for_user(client, kind, entity_id, user_email):
@@ -94,9 +259,19 @@ def get_entity_for_user(client, kind, entity_id, user_email):
 
     Why: This prevents users from accessing other users' data. Every
     GET/PUT/DELETE operation must verify ownership to maintain security.
+    Entities are remembered for the rest of the request (see
+    get_request_entity_cache), but ownership is still checked on every call.
     """
-    key = client.key(kind, entity_id)
-    entity = client.get(key)
+    cache = get_request_entity_cache()
+    if cache is not None and (kind, entity_id) in cache:
+        entity = cache[(kind, entity_id)]
+    else:
+        key = client.key(kind, entity_id)
+        entity = client.get(key)
+        # Only remember entities that exist, so one created later in the
+        # request isn't hidden by a cached "not found"
+        if cache is not None and entity is not None:
+            cache[(kind, entity_id)] = entity
 
     # Check if entity exists and belongs to this user
     if entity and entity.get('user_email') == user_email:
@@ -105,6 +280,98 @@ def get_entity_for_user(client, kind, entity_id, user_email):
     return None
 
 
+def get_entities_for_user(client, kinds_and_ids, user_email):
+    """
+    Get several entities by ID in one request, verifying each belongs to the user.
+
+    Args:
+        client: datastore.Client instance
+        kinds_and_ids: List of (kind, entity_id) tuples
+        user_email: Email of the authenticated user
+
+    Returns:
+        List with one entry per (kind, entity_id): the entity if found and
+        owned by the user, otherwise None
+
+    Why: get_multi fetches all the keys in a single round trip, instead of
+    one get_entity_for_user call (and round trip) per entity.
+
+    Example:
+        session_entity, camp = get_entities_for_user(
+            client,
+            [('Session', session_id), ('Camp', camp_id)],
+            user_email
+        )
+    """
+    keys = [client.key(kind, entity_id) for kind, entity_id in kinds_and_ids]
+
+    # get_multi doesn't keep the order of the keys, so match results by key
+    found = {entity.key: entity for entity in client.get_multi(keys)}
+
+    results = []
+    for key in keys:
+        entity = found.get(key)
+        # Check if entity exists and belongs to this user
+        if entity and entity.get('user_email') == user_email:
+            results.append(entity)
+        else:
+            results.append(None)
+    return results
+
+
+def get_visible_entities(client, kind, entity_ids, visible_emails):
+    """
+    Get many entities of one kind by ID, keeping those owned by any visible user.
+
+    Args:
+        client: datastore.Client instance
+        kind: Entity kind (e.g., 'Session', 'Camp')
+        entity_ids: IDs to look up (duplicates and None are skipped)
+        visible_emails: Emails whose entities the current user may see
+                        (themselves + co-parents)
+
+    Returns:
+        Dict of entity_id -> entity, for entities that exist and are owned
+        by one of visible_emails
+
+    Why: Pages like the schedule resolve the session and camp of every
+    booking. Looking them up one at a time costs a round trip per booking;
+    get_multi fetches all of them together (in chunks of 500 keys).
+    """
+    unique_ids = list(dict.fromkeys(entity_id for entity_id in entity_ids if entity_id))
+    keys = [client.key(kind, entity_id) for entity_id in unique_ids]
+
+    found = {}
+    for start in range(0, len(keys), DATASTORE_BATCH_LIMIT):
+        for entity in client.get_multi(keys[start:start + DATASTORE_BATCH_LIMIT]):
+            # Check the entity belongs to someone this user can see
+            if entity.get('user_email') in visible_emails:
+                found[entity.key.name] = entity
+    return found
+
+
+def is_same_value(stored_value, new_value):
+    """
+    Check whether a new property value matches the one already stored.
+
+    Args:
+        stored_value: Value read from the Datastore entity
+        new_value: Value about to be saved (e.g. from a form parser)
+
+    Returns:
+        bool: True if saving new_value wouldn't change anything
+
+    Why: Datastore gives back timezone-aware (UTC) datetimes, but form
+    parsers like parse_form_date return naive ones for the same moment.
+    A plain != says those always differ, so naive values are treated as
+    UTC before comparing (which is how Datastore stores them anyway).
+    """
+    if (isinstance(stored_value, datetime) and isinstance(new_value, datetime)
+            and stored_value.tzinfo is not None and new_value.tzinfo is None):
+        new_value = new_value.replace(tzinfo=timezone.utc)
+    return stored_value == new_value
+
+
 def update_entity(client, entity, properties):
     """
     Update an existing entity with new properties and refresh updated_at.
@@ -119,15 +386,28 @@ def update_entity(client, entity, properties):
 
     Why: Always update the updated_at timestamp when modifying entities.
     This helps track when data changed and makes debugging easier.
+    If none of the properties actually change (e.g. an edit form saved
+    without edits), nothing is written and updated_at stays the same.
+
+    Inside a `with client.batch():` or `with client.transaction():` block,
+    the save is queued and sent with every other queued change in one
+    commit when the block ends.
     """
+    # Only keep the properties whose values are different
+    changed = {key: value for key, value in properties.items()
+               if key not in entity or not is_same_value(entity[key], value)}
+    if not changed:
+        return entity
+
     # Update the timestamp
-    entity['updated_at'] = datetime.now(timezone.utc)
+    entity['updated_at'] = request_timestamp()
 
     # Update the properties
-    entity.update(properties)
+    entity.update(changed)
 
     # Save to Datastore
     client.put(entity)
+    forget_cached_entities([entity.key])
 
     return entity
 
@@ -144,9 +424,28 @@ def delete_entity(client, entity):
     future enhancements (e.g., soft deletes, audit logging).
     """
     client.delete(entity.key)
+    forget_cached_entities([entity.key])
+
+
+def delete_entities(client, entities):
+    """
+    Delete several entities from Datastore in batched requests.
 
+    Args:
+        client: datastore.Client instance
+        entities: List of entities to delete
 
-def query_by_user(client, kind, user_email, order_by=None, filters=None):
+    Why: Deleting one at a time costs a round trip per entity. delete_multi
+    removes up to 500 keys (Datastore's batch limit) in one request.
+    """
+    keys = [entity.key for entity in entities]
+    for start in range(0, len(keys), DATASTORE_BATCH_LIMIT):
+        client.delete_multi(keys[start:start + DATASTORE_BATCH_LIMIT])
+    forget_cached_entities(keys)
+
+
+def query_by_user(client, kind, user_email, order_by=None, filters=None, limit=None, keys_only=False,
+                  projection=None):
     """
     Query entities of a specific kind for a specific user.
 
@@ -154,8 +453,16 @@ def query_by_user(client, kind, user_email, order_by=None, filters=None):
         client: datastore.Client instance
         kind: Entity kind to query
         user_email: Email of the authenticated user
-        order_by: Optional field name to sort by (e.g., 'created_at')
+        order_by: Optional field name to sort by (e.g., 'created_at'), or a
+                  list of field names to sort by several fields in order
         filters: Optional list of (property, operator, value) tuples
+        limit: Optional maximum number of entities to return
+        keys_only: If True, return entities with only their keys filled in
+                   (cheaper when you just need IDs or want to delete them)
+        projection: Optional list of property names to load; the returned
+                    entities contain only those properties. Projection
+                    queries need a composite index (user_email first, then
+                    the projected properties) in index.yaml.
 
     Returns:
         List of entities owned by the user
@@ -177,19 +484,189 @@ def query_by_user(client, kind, user_email, order_by=None, filters=None):
     query = client.query(kind=kind)
 
     # Always filter by user_email (critical for security)
-    query.add_filter('user_email', '=', user_email)
+    query.add_filter(filter=PropertyFilter('user_email', '=', user_email))
 
     # Add any additional filters
     if filters:
         for prop, operator, value in filters:
-            query.add_filter(prop, operator, value)
+            query.add_filter(filter=PropertyFilter(prop, operator, value))
 
     # Add ordering if specified
     if order_by:
-        query.order = [order_by]
+        query.order = order_by if isinstance(order_by, list) else [order_by]
+
+    # Skip loading properties when the caller only needs keys
+    if keys_only:
+        query.keys_only()
+
+    # Only load the listed properties (served straight from the index)
+    if projection:
+        query.projection = projection
 
     # Execute query and return results
-    return list(query.fetch())
+    return list(query.fetch(limit=limit))
+
+
+def query_page_by_user(client, kind, user_email, order_by=None, filters=None, page_size=50, cursor=None):
+    """
+    Get one page of a user's entities, plus a cursor for the next page.
+
+    Args:
+        client: datastore.Client instance
+        kind: Entity kind to query
+        user_email: Email of the authenticated user
+        order_by: Optional field name (or list of field names) to sort by
+        filters: Optional list of (property, operator, value) tuples
+        page_size: Maximum number of entities on one page
+        cursor: Cursor string from the previous page, or None for the first page.
+                An invalid cursor (e.g. from a hand-edited URL) gives the first page.
+
+    Returns:
+        Tuple of (entities, next_cursor). next_cursor is a string to pass
+        back in for the following page, or None when there are no more.
+
+    Why: query_by_user loads every matching entity. List pages that keep
+    growing over the years (like trips) can show one page at a time, so
+    each request reads a bounded number of entities.
+
+    Example:
+        trips, next_cursor = query_page_by_user(
+            client, 'Trip', user_email, order_by='start_date',
+            cursor=request.args.get('cursor')
+        )
+    """
+    query = client.query(kind=kind)
+
+    # Always filter by user_email (critical for security)
+    query.add_filter(filter=PropertyFilter('user_email', '=', user_email))
+
+    # Add any additional filters
+    if filters:
+        for prop, operator, value in filters:
+            query.add_filter(filter=PropertyFilter(prop, operator, value))
+
+    # Add ordering if specified
+    if order_by:
+        query.order = order_by if isinstance(order_by, list) else [order_by]
+
+    try:
+        iterator = query.fetch(limit=page_size, start_cursor=cursor)
+        entities = list(iterator)
+    except (ValueError, BadRequest) as e:
+        # Cursors come from the URL, so they may be truncated, edited, or
+        # from an old bookmark. Garbled base64 raises ValueError here and
+        # Datastore rejects a cursor that doesn't match the query with
+        # BadRequest; either way, show the first page instead of an error.
+        if cursor is None:
+            raise
+        print(f"Ignoring invalid {kind} page cursor: {e}")
+        iterator = query.fetch(limit=page_size)
+        entities = list(iterator)
+
+    # The cursor comes back as bytes; templates and URLs need a string.
+    # A short page means we've reached the end.
+    next_cursor = iterator.next_page_token
+    if next_cursor is None or len(entities) < page_size:
+        return entities, None
+    return entities, next_cursor.decode('ascii')
+
+
+def run_concurrently(calls):
+    """
+    Run several independent Datastore reads at the same time.
+
+    Args:
+        calls: List of (function, arg1, arg2, ...) tuples
+
+    Returns:
+        List of each function's return value, in the same order as calls
+
+    Raises:
+        Whatever exception the first failing call raised
+
+    Why: Each query waits on a network round trip. Running independent
+    queries on the shared thread pool means a page waits roughly as long
+    as the slowest query, instead of the sum of all of them.
+
+    The functions run on worker threads without a Flask request, so they
+    should only use the Datastore client (not flask.g or the session),
+    and must not call run_concurrently themselves.
+
+    Example:
+        kids, weeks = run_concurrently([
+            (get_accessible_kids, client, user_email),
+            (query_by_user, client, 'Week', user_email, 'week_number'),
+        ])
+    """
+    futures = [_datastore_read_executor.submit(*call) for call in calls]
+    return [future.result() for future in futures]
+
+
+def count_by_user(client, kind, user_email, filters=None):
+    """
+    Count entities of a specific kind for a specific user.
+
+    Args:
+        client: datastore.Client instance
+        kind: Entity kind to count
+        user_email: Email of the authenticated user
+        filters: Optional list of (property, operator, value) tuples
+
+    Returns:
+        int: Number of matching entities
+
+    Why: When we only need "how many", a count aggregation lets Datastore
+    do the counting and send back one number instead of every entity.
+
+    Example:
+        session_count = count_by_user(
+            client,
+            'Session',
+            user_email,
+            filters=[('camp_id', '=', camp_id)]
+        )
+    """
+    query = client.query(kind=kind)
+
+    # Always filter by user_email (critical for security)
+    query.add_filter(filter=PropertyFilter('user_email', '=', user_email))
+
+    # Add any additional filters
+    if filters:
+        for prop, operator, value in filters:
+            query.add_filter(filter=PropertyFilter(prop, operator, value))
+
+    # Ask Datastore for the count only
+    aggregation_query = client.aggregation_query(query).count(alias='total')
+    for aggregation_results in aggregation_query.fetch():
+        for result in aggregation_results:
+            if result.alias == 'total':
+                return result.value
+
+    return 0
+
+
+def session_counts_by_camp(client, user_email):
+    """
+    Count a user's sessions for each of their camps.
+
+    Args:
+        client: datastore.Client instance
+        user_email: Email of the user who owns the sessions
+
+    Returns:
+        Counter: camp_id -> number of sessions
+
+    Why: The camps list shows a session count for every camp. One query
+    for all of the user's sessions replaces one query per camp, and the
+    projection means Datastore only sends back each session's camp_id
+    (served from the user_email + camp_id index in index.yaml).
+    """
+    query = client.query(kind='Session')
+    query.add_filter(filter=PropertyFilter('user_email', '=', user_email))
+    query.projection = ['camp_id']
+
+    return Counter(entity['camp_id'] for entity in query.fetch())
 
 
 def entity_to_dict(entity):
@@ -209,25 +686,98 @@ def entity_to_dict(entity):
     if not entity:
         return None
 
-    # Start with all entity properties
-    result = dict(entity)
+    # Copy the entity's properties, converting datetime objects to strings
+    # for template/form compatibility
+    datetime_fields = DATETIME_FIELDS.get(entity.key.kind)
+    if datetime_fields is None:
+        # Unknown kind: check every value while copying (one pass)
+        result = {key: format_entity_value(value) for key, value in entity.items()}
+    else:
+        # Known kind: plain copy, then convert just its datetime properties
+        result = dict(entity)
+        for key in datetime_fields:
+            if key in result:
+                result[key] = format_entity_value(result[key])
 
     # Add the entity ID (from the key)
     result['id'] = entity.key.name
 
-    # Convert datetime objects to strings for template/form compatibility
-    for key, value in result.items():
-        if isinstance(value, datetime):
-            # For date fields (no time component), format as YYYY-MM-DD for HTML date inputs
-            # For datetime fields with time, use ISO format
-            if value.hour == 0 and value.minute == 0 and value.second == 0:
-                result[key] = value.strftime('%Y-%m-%d')
-            else:
-                result[key] = value.isoformat()
-
     return result
 
 
+def format_entity_value(value):
+    """
+    Convert one entity property value to its template/form-friendly form.
+
+    Args:
+        value: Any property value from a Datastore entity
+
+    Returns:
+        The value, with datetimes turned into strings
+
+    Why: For date fields (no time component), format as YYYY-MM-DD for HTML
+    date inputs. For datetime fields with time, use ISO format.
+    """
+    if isinstance(value, datetime):
+        if value.hour == 0 and value.minute == 0 and value.second == 0:
+            return value.strftime('%Y-%m-%d')
+        return value.isoformat()
+    return value
+
+
+class EntityView(MutableMapping):
+    """
+    A dict-like view of an entity that converts values only when read.
+
+    Reads give the same values as entity_to_dict(entity), including 'id',
+    but each property is converted the first time a template asks for it
+    instead of all at once. Setting a key (e.g. camp['is_owner'] = True)
+    stores it on the view without changing the entity.
+
+    Why: Pages like the camps list build one dict per entity but only show
+    a few fields of each, so converting every property is wasted work.
+
+    Example:
+        camp = EntityView(camp_entity)
+        camp['name']        # read straight from the entity
+        camp['is_owner'] = True
+    """
+
+    def __init__(self, entity):
+        self._entity = entity
+        self._values = {'id': entity.key.name}
+        self._deleted = set()
+
+    def __getitem__(self, key):
+        if key in self._deleted:
+            raise KeyError(key)
+        if key not in self._values:
+            # Raises KeyError for missing properties, just like a dict
+            self._values[key] = format_entity_value(self._entity[key])
+        return self._values[key]
+
+    def __setitem__(self, key, value):
+        self._deleted.discard(key)
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        self._deleted.add(key)
+
+    def __iter__(self):
+        keys = dict.fromkeys(self._entity)
+        keys.update(dict.fromkeys(self._values))
+        return (key for key in keys if key not in self._deleted)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        return key not in self._deleted and (key in self._values or key in self._entity)
+
+
 def entities_to_dict_list(entities):
     """
     Convert a list of Datastore entities to a list of dictionaries.
@@ -268,8 +818,9 @@ def create_share_token(client, user_email):
     key = client.key('ShareToken', token)
     entity = datastore.Entity(key=key)
     entity['user_email'] = user_email
-    entity['created_at'] = datetime.now(timezone.utc)
-    entity['updated_at'] = datetime.now(timezone.utc)
+    now = request_timestamp()
+    entity['created_at'] = now
+    entity['updated_at'] = now
     client.put(entity)
     return token
 
@@ -307,9 +858,8 @@ def get_share_token_for_user(client, user_email):
     Why: Used to check if a user already has a share link before creating
     a new one, and to display the existing share URL.
     """
-    query = client.query(kind='ShareToken')
-    query.add_filter('user_email', '=', user_email)
-    tokens = list(query.fetch(limit=1))
+    # The token is the key name, so the entity's properties aren't needed
+    tokens = query_by_user(client, 'ShareToken', user_email, limit=1, keys_only=True)
     if tokens:
         return tokens[0].key.name  # The token is stored as the key name
     return None
@@ -329,11 +879,9 @@ def delete_share_token_for_user(client, user_email):
     Why: When a user wants to revoke their share link, we delete all
     their tokens. This invalidates any shared URLs immediately.
     """
-    query = client.query(kind='ShareToken')
-    query.add_filter('user_email', '=', user_email)
-    tokens = list(query.fetch())
-    for token in tokens:
-        client.delete(token.key)
+    # Only the keys are needed to delete the tokens
+    tokens = query_by_user(client, 'ShareToken', user_email, keys_only=True)
+    delete_entities(client, tokens)
     return len(tokens)
 
 
@@ -364,7 +912,7 @@ def create_kid_access(client, kid_id, user_email, role, granted_by):
     key = client.key('KidAccess', entity_id)
     entity = datastore.Entity(key=key)
 
-    now = datetime.now(timezone.utc)
+    now = request_timestamp()
     entity['kid_id'] = kid_id
     entity['user_email'] = user_email
     entity['role'] = role
@@ -389,8 +937,8 @@ def get_kid_access(client, kid_id, user_email):
         The KidAccess entity if found, None otherwise
     """
     query = client.query(kind='KidAccess')
-    query.add_filter('kid_id', '=', kid_id)
-    query.add_filter('user_email', '=', user_email)
+    query.add_filter(filter=PropertyFilter('kid_id', '=', kid_id))
+    query.add_filter(filter=PropertyFilter('user_email', '=', user_email))
     results = list(query.fetch(limit=1))
     return results[0] if results else None
 
@@ -410,17 +958,14 @@ def get_accessible_kid_ids(client, user_email):
     It includes both kids they own and kids shared with them.
     Also includes fallback for pre-migration kids (user_email field on Kid).
     """
-    # First, check KidAccess table
-    query = client.query(kind='KidAccess')
-    query.add_filter('user_email', '=', user_email)
-    access_records = list(query.fetch())
+    # First, check KidAccess table (only the kid_id of each record is needed)
+    access_records = query_by_user(client, 'KidAccess', user_email, projection=['kid_id'])
     kid_ids = [r['kid_id'] for r in access_records]
 
     # FALLBACK: Also include kids with user_email matching (pre-migration)
     # This ensures existing users still see their kids before migration runs
-    legacy_query = client.query(kind='Kid')
-    legacy_query.add_filter('user_email', '=', user_email)
-    for kid in legacy_query.fetch():
+    # Only the keys are needed here
+    for kid in query_by_user(client, 'Kid', user_email, keys_only=True):
         if kid.key.name not in kid_ids:
             kid_ids.append(kid.key.name)
 
@@ -544,7 +1089,7 @@ def get_kid_access_list(client, kid_id):
         List of KidAccess entities for this kid
     """
     query = client.query(kind='KidAccess')
-    query.add_filter('kid_id', '=', kid_id)
+    query.add_filter(filter=PropertyFilter('kid_id', '=', kid_id))
     return list(query.fetch())
 
 
@@ -580,7 +1125,7 @@ def delete_all_kid_access(client, kid_id):
     Why: Called when deleting a kid to clean up access records.
     """
     query = client.query(kind='KidAccess')
-    query.add_filter('kid_id', '=', kid_id)
+    query.add_filter(filter=PropertyFilter('kid_id', '=', kid_id))
     access_records = list(query.fetch())
     for record in access_records:
         client.delete(record.key)
@@ -26,6 +26,7 @@ from datastore_helpers import (
     update_entity,
     delete_entity,
     query_by_user,
+    query_page_by_user,
     entity_to_dict,
     entities_to_dict_list,
     # Kid access functions (multi-parent support)
@@ -40,11 +41,14 @@ from datastore_helpers import (
     delete_all_kid_access
 )
 from schedule import update_week_blocking  # For updating week blocking after trip changes
-from datetime import datetime, date
+from form_helpers import parse_form_date, parse_comma_list
 
 # Create the blueprint
 family_bp = Blueprint('family', __name__, url_prefix='/family')
 
+# How many trips the trips list shows per page
+TRIPS_PAGE_SIZE = 50
+
 
 # ============================================================================
 # PARENT ROUTES
@@ -256,13 +260,13 @@ def kid_new():
         client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
 
         # Parse the dates (keep as datetime for Datastore compatibility)
-        birthday = datetime.strptime(request.form['birthday'], '%Y-%m-%d')
-        last_day_of_school = datetime.strptime(request.form['last_day_of_school'], '%Y-%m-%d')
-        first_day_of_school = datetime.strptime(request.form['first_day_of_school'], '%Y-%m-%d')
+        birthday = parse_form_date(request.form['birthday'])
+        last_day_of_school = parse_form_date(request.form['last_day_of_school'])
+        first_day_of_school = parse_form_date(request.form['first_day_of_school'])
 
         # Parse friends (comma-separated)
         friends_str = request.form.get('friends', '')
-        friends = [f.strip() for f in friends_str.split(',') if f.strip()]
+        friends = parse_comma_list(friends_str)
 
         # Create the kid entity
         kid = create_entity(
@@ -344,13 +348,13 @@ def kid_update(id):
         return redirect(url_for('family.kids_list'))
 
     # Parse the dates (keep as datetime for Datastore compatibility)
-    birthday = datetime.strptime(request.form['birthday'], '%Y-%m-%d')
-    last_day_of_school = datetime.strptime(request.form['last_day_of_school'], '%Y-%m-%d')
-    first_day_of_school = datetime.strptime(request.form['first_day_of_school'], '%Y-%m-%d')
+    birthday = parse_form_date(request.form['birthday'])
+    last_day_of_school = parse_form_date(request.form['last_day_of_school'])
+    first_day_of_school = parse_form_date(request.form['first_day_of_school'])
 
     # Parse friends (comma-separated)
     friends_str = request.form.get('friends', '')
-    friends = [f.strip() for f in friends_str.split(',') if f.strip()]
+    friends = parse_comma_list(friends_str)
 
     # Update the kid
     update_entity(
@@ -562,13 +566,22 @@ def trips_list():
     user = get_current_user()
     client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
 
-    # Query all trips for this user, ordered by start date
-    trips = query_by_user(client, 'Trip', user['email'], order_by='start_date')
+    # Query one page of trips for this user, ordered by start date
+    trips, next_cursor = query_page_by_user(
+        client,
+        'Trip',
+        user['email'],
+        order_by='start_date',
+        page_size=TRIPS_PAGE_SIZE,
+        cursor=request.args.get('cursor')
+    )
 
     return render_template(
         'trips_list.html',
         user=user,
-        trips=entities_to_dict_list(trips)
+        trips=entities_to_dict_list(trips),
+        next_cursor=next_cursor,
+        is_later_page=bool(request.args.get('cursor'))
     )
 
 
@@ -588,28 +601,33 @@ def trip_new():
         client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
 
         # Parse the dates (keep as datetime for Datastore compatibility)
-        start_date = datetime.strptime(request.form['start_date'], '%Y-%m-%d')
-        end_date = datetime.strptime(request.form['end_date'], '%Y-%m-%d')
+        start_date = parse_form_date(request.form['start_date'])
+        end_date = parse_form_date(request.form['end_date'])
 
         # Validate dates
         if end_date < start_date:
             flash('End date must be after start date.', 'error')
             return redirect(url_for('family.trip_new'))
 
-        # Create the trip entity
-        trip = create_entity(
-            client,
-            'Trip',
-            user['email'],
-            {
-                'name': request.form['name'],
-                'start_date': start_date,
-                'end_date': end_date
-            }
-        )
-
-        # Recalculate weeks to update blocked status
-        update_week_blocking(client, user['email'])
+        # Read the existing trips before the batch starts
+        other_trips = query_by_user(client, 'Trip', user['email'])
+
+        # Save the trip and any week blocking changes in one commit
+        with client.batch():
+            # Create the trip entity
+            trip = create_entity(
+                client,
+                'Trip',
+                user['email'],
+                {
+                    'name': request.form['name'],
+                    'start_date': start_date,
+                    'end_date': end_date
+                }
+            )
+
+            # Recalculate weeks to update blocked status
+            update_week_blocking(client, user['email'], trips=other_trips + [trip])
 
         flash(f"Trip '{request.form['name']}' created successfully!", 'success')
         return redirect(url_for('family.trips_list'))
@@ -664,27 +682,42 @@ def trip_update(id):
         return redirect(url_for('family.trips_list'))
 
     # Parse the dates (keep as datetime for Datastore compatibility)
-    start_date = datetime.strptime(request.form['start_date'], '%Y-%m-%d')
-    end_date = datetime.strptime(request.form['end_date'], '%Y-%m-%d')
+    start_date = parse_form_date(request.form['start_date'])
+    end_date = parse_form_date(request.form['end_date'])
 
     # Validate dates
     if end_date < start_date:
         flash('End date must be after start date.', 'error')
         return redirect(url_for('family.trip_view', id=id))
 
-    # Update the trip
-    update_entity(
-        client,
-        trip,
-        {
-            'name': request.form['name'],
-            'start_date': start_date,
-            'end_date': end_date
-        }
+    # Week blocking only depends on the dates, so a name-only edit can skip
+    # the recalculation. Compare calendar days: stored dates come back from
+    # Datastore in UTC, while the form's are plain dates.
+    dates_changed = (
+        trip['start_date'].date() != start_date.date()
+        or trip['end_date'].date() != end_date.date()
     )
 
-    # Recalculate weeks to update blocked status
-    update_week_blocking(client, user['email'])
+    trip_properties = {
+        'name': request.form['name'],
+        'start_date': start_date,
+        'end_date': end_date
+    }
+
+    if not dates_changed:
+        # Update the trip
+        update_entity(client, trip, trip_properties)
+    else:
+        # Read the user's other trips before the batch starts
+        other_trips = [t for t in query_by_user(client, 'Trip', user['email']) if t.key != trip.key]
+
+        # Save the trip and any week blocking changes in one commit
+        with client.batch():
+            # Update the trip
+            update_entity(client, trip, trip_properties)
+
+            # Recalculate weeks to update blocked status
+            update_week_blocking(client, user['email'], trips=other_trips + [trip])
 
     flash(f"Trip '{request.form['name']}' updated successfully!", 'success')
     return redirect(url_for('family.trips_list'))
@@ -711,10 +744,16 @@ def trip_delete(id):
         return redirect(url_for('family.trips_list'))
 
     name = trip['name']
-    delete_entity(client, trip)
 
-    # Recalculate weeks to update blocked status
-    update_week_blocking(client, user['email'])
+    # Read the user's other trips before the batch starts
+    other_trips = [t for t in query_by_user(client, 'Trip', user['email']) if t.key != trip.key]
+
+    # Delete the trip and save any week blocking changes in one commit
+    with client.batch():
+        delete_entity(client, trip)
+
+        # Recalculate weeks to update blocked status
+        update_week_blocking(client, user['email'], trips=other_trips)
 
     flash(f"Trip '{name}' deleted successfully.", 'success')
     return redirect(url_for('family.trips_list'))
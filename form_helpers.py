@@ -0,0 +1,149 @@
+"""
+Form parsing helpers shared by the blueprints.
+
+These turn submitted form text (dates, times, comma-separated lists, and
+the session form) into Python values for Datastore entities.
+
+Why this module exists:
+camps, family and schedule all parse the same kinds of form fields. The
+helpers don't use Flask or Datastore, so keeping them here lets those
+blueprints share them without importing each other (and makes them easy
+to test on their own).
+"""
+
+from datetime import date, datetime, time
+
+
+def parse_form_date(date_str):
+    """
+    Parse a 'YYYY-MM-DD' date from a form or the AI parser into a datetime.
+
+    Args:
+        date_str: Date string like '2025-06-16'
+
+    Returns:
+        datetime: Midnight on that date
+
+    Raises:
+        ValueError: If the string isn't a valid date
+
+    Why: date.fromisoformat is written in C and much faster than
+    datetime.strptime, which has to interpret a format string every call.
+    """
+    return datetime.combine(date.fromisoformat(date_str), time())
+
+
+def parse_comma_list(text):
+    """
+    Split a comma-separated form field into a list of trimmed names.
+
+    Args:
+        text: Text like 'Ava, Ben,, Cal '
+
+    Returns:
+        list: Non-empty names with spaces trimmed, e.g. ['Ava', 'Ben', 'Cal']
+
+    Why: Friends lists are typed as free text in several forms. Each name
+    is trimmed once, and blank entries (like from a trailing comma) are
+    dropped.
+    """
+    names = (name.strip() for name in text.split(','))
+    return [name for name in names if name]
+
+
+def parse_optional_date(date_str):
+    """
+    Parse a 'YYYY-MM-DD' date that may be missing or malformed.
+
+    Args:
+        date_str: Date string, or None/empty
+
+    Returns:
+        datetime: Midnight on that date, or None if missing or invalid
+
+    Why: AI-parsed sessions sometimes leave dates out or get the format
+    wrong. We'd rather save the session without that date than fail.
+    """
+    if not date_str:
+        return None
+    try:
+        return parse_form_date(date_str)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_form_datetime(datetime_str):
+    """
+    Parse a 'YYYY-MM-DD HH:MM' date and time (e.g. registration opening).
+
+    Args:
+        datetime_str: Date and time string like '2025-03-01 09:00'
+
+    Returns:
+        datetime: The parsed date and time
+
+    Raises:
+        ValueError: If the string isn't a valid date and time
+    """
+    date_str, time_str = datetime_str.split(' ', 1)
+    return datetime.combine(date.fromisoformat(date_str), time.fromisoformat(time_str))
+
+
+# Session form fields as (field name, converter, value when left blank).
+# parse_session_form reads each field once and converts it with this table.
+SESSION_FORM_FIELDS = (
+    ('age_min', int, None),
+    ('age_max', int, None),
+    ('grade_min', int, None),
+    ('grade_max', int, None),
+    ('duration_weeks', int, 1),
+    ('session_start_date', parse_form_date, None),
+    ('session_end_date', parse_form_date, None),
+    ('start_time', str, ''),
+    ('end_time', str, ''),
+    ('dropoff_window_start', str, ''),
+    ('dropoff_window_end', str, ''),
+    ('pickup_window_start', str, ''),
+    ('pickup_window_end', str, ''),
+    ('url', str, ''),
+    ('cost', float, None),
+    ('early_care_cost', float, None),
+    ('late_care_cost', float, None),
+)
+
+
+def parse_session_form(form):
+    """
+    Turn a submitted session form into Session entity properties.
+
+    Args:
+        form: request.form from the new/edit session page
+
+    Returns:
+        dict: Session properties (everything except camp_id and holidays)
+
+    Raises:
+        ValueError: If a number or date field isn't valid
+
+    Why: Creating and updating a session use the same form, so they share
+    one parser and can't drift apart. Most fields are described in
+    SESSION_FORM_FIELDS, so adding a field is a one-line change.
+    """
+    properties = {'name': form['name']}
+
+    for field, convert, blank_value in SESSION_FORM_FIELDS:
+        value = form.get(field)
+        properties[field] = convert(value) if value else blank_value
+
+    # Checkboxes are only sent when ticked
+    properties['early_care_available'] = 'early_care_available' in form
+    properties['late_care_available'] = 'late_care_available' in form
+
+    # Registration opening needs both the date and the time
+    properties['registration_open_date'] = None
+    if form.get('registration_open_date') and form.get('registration_open_time'):
+        properties['registration_open_date'] = parse_form_datetime(
+            f"{form['registration_open_date']} {form['registration_open_time']}"
+        )
+
+    return properties
@@ -21,10 +21,14 @@ from auth import login_required, get_current_user
 from datastore_helpers import (
     get_datastore_client,
     create_entity,
+    create_entities,
     get_entity_for_user,
+    get_visible_entities,
     update_entity,
     delete_entity,
+    delete_entities,
     query_by_user,
+    run_concurrently,
     entity_to_dict,
     entities_to_dict_list,
     # Share token functions
@@ -38,10 +42,12 @@ from datastore_helpers import (
     get_kid_with_access_check,
     get_co_parent_emails
 )
+from google.cloud.datastore.query import PropertyFilter
+from form_helpers import parse_comma_list
 from calendar_integration import (
-    create_booking_event,
-    update_booking_event,
-    delete_booking_event
+    schedule_create_booking_events_batch,
+    schedule_update_booking_event,
+    schedule_delete_booking_event
 )
 from datetime import datetime, timedelta
 import uuid
@@ -54,6 +60,26 @@ schedule_bp = Blueprint('schedule', __name__, url_prefix='/schedule')
 # WEEK CALCULATION HELPERS
 # ============================================================================
 
+def trip_overlaps_week(trip, week_start, week_end):
+    """
+    Check whether a trip overlaps a week (by calendar day).
+
+    Args:
+        trip: Trip entity (or dict) with start_date and end_date datetimes
+        week_start: Datetime of the week's Monday
+        week_end: Datetime of the week's Friday
+
+    Returns:
+        bool: True if at least one day of the trip falls within the week
+
+    Why: Dates read back from Datastore are timezone-aware (UTC), while
+    dates parsed from a form are naive. Python refuses to compare the two,
+    so both sides are reduced to plain dates first.
+    """
+    return (trip['start_date'].date() <= week_end.date()
+            and trip['end_date'].date() >= week_start.date())
+
+
 def calculate_weeks_for_user(client, user_email):
     """
     Calculate summer weeks based on kids' school dates.
@@ -104,12 +130,15 @@ def calculate_weeks_for_user(client, user_email):
     first_monday = earliest_last_day + timedelta(days=days_until_monday)
 
     # Delete existing weeks for this user (we're recalculating)
-    existing_weeks = query_by_user(client, 'Week', user_email)
-    for week in existing_weeks:
-        delete_entity(client, week)
+    # Only the keys are needed to delete them
+    existing_weeks = query_by_user(client, 'Week', user_email, keys_only=True)
+    delete_entities(client, existing_weeks)
+
+    # Trips decide which weeks are blocked, so load them before building weeks
+    trips = list(query_by_user(client, 'Trip', user_email))
 
     # Generate weeks from first Monday until the day before school starts
-    weeks = []
+    new_weeks = []
     week_number = 1
     current_monday = first_monday
 
@@ -121,54 +150,52 @@ def calculate_weeks_for_user(client, user_email):
         if week_end >= latest_first_day:
             break
 
-        # Create the week entity
-        week = create_entity(
-            client,
-            'Week',
-            user_email,
-            {
-                'week_number': week_number,
-                'start_date': current_monday,
-                'end_date': week_end,
-                'is_blocked': False  # Will be updated by trip blocking
-            }
-        )
-        weeks.append(week)
+        # Apply trip blocking: a week is blocked if any trip overlaps it
+        is_blocked = False
+        for trip in trips:
+            if trip_overlaps_week(trip, current_monday, week_end):
+                is_blocked = True
+                break
+
+        # Week properties (all weeks are saved together below)
+        new_weeks.append({
+            'week_number': week_number,
+            'start_date': current_monday,
+            'end_date': week_end,
+            'is_blocked': is_blocked
+        })
 
         week_number += 1
         current_monday += timedelta(days=7)  # Next Monday
 
-    # Apply trip blocking
-    trips = query_by_user(client, 'Trip', user_email)
-    for week in weeks:
-        week_start = week['start_date']
-        week_end = week['end_date']
-
-        for trip in trips:
-            trip_start = trip['start_date']
-            trip_end = trip['end_date']
-
-            # Check if trip overlaps with this week
-            if trip_start <= week_end and trip_end >= week_start:
-                week['is_blocked'] = True
-                update_entity(client, week, {'is_blocked': True})
-                break
+    # Save every week in one batch instead of one put per week
+    weeks = create_entities(client, 'Week', user_email, new_weeks)
 
     return weeks
 
 
-def update_week_blocking(client, user_email):
+def update_week_blocking(client, user_email, trips=None):
     """
     Update the is_blocked status on all weeks based on current trips.
 
     Unlike calculate_weeks_for_user, this does NOT delete/recreate weeks.
     It only updates the blocking status, preserving week IDs and bookings.
 
-    Use this after trip changes (create, update, delete).
+    Args:
+        client: datastore.Client instance
+        user_email: Email of the user whose weeks to update
+        trips: The user's trips, if the caller already has them (for
+               example, including a trip change that isn't saved yet).
+               Loaded from Datastore when not given.
+
+    Use this after trip changes (create, update, delete). Call it inside
+    `with client.batch():` together with the trip change, so the trip and
+    all changed weeks are saved in one commit.
     """
-    # Get all weeks and trips for this user
+    # Get all weeks (and trips, unless the caller passed them) for this user
     weeks = query_by_user(client, 'Week', user_email)
-    trips = list(query_by_user(client, 'Trip', user_email))
+    if trips is None:
+        trips = query_by_user(client, 'Trip', user_email)
 
     for week in weeks:
         week_start = week['start_date']
@@ -177,11 +204,7 @@ def update_week_blocking(client, user_email):
         # Check if any trip overlaps with this week
         is_blocked = False
         for trip in trips:
-            trip_start = trip['start_date']
-            trip_end = trip['end_date']
-
-            # Check if trip overlaps with this week
-            if trip_start <= week_end and trip_end >= week_start:
+            if trip_overlaps_week(trip, week_start, week_end):
                 is_blocked = True
                 break
 
@@ -298,51 +321,58 @@ def bookings_list():
     user = get_current_user()
     client = get_datastore_client(current_app.config['GCP_PROJECT_ID'])
 
-    # Get all accessible kids and their bookings
-    kids = get_accessible_kids(client, user['email'])
+    # Get all accessible kids, and co-parent emails for looking up their
+    # sessions/camps (independent reads, so run them at the same time)
+    kids, co_parent_emails = run_concurrently([
+        (get_accessible_kids, client, user['email']),
+        (get_co_parent_emails, client, user['email']),
+    ])
     accessible_kid_ids = [k.key.name for k in kids]
 
-    # Get bookings for all accessible kids
+    # Get bookings for all accessible kids, one query per kid at the same time
     bookings = []
-    for kid_id in accessible_kid_ids:
-        query = client.query(kind='Booking')
-        query.add_filter('kid_id', '=', kid_id)
-        bookings.extend(list(query.fetch()))
+    for kid_bookings in run_concurrently([
+        (query_bookings_for_kid, client, kid_id) for kid_id in accessible_kid_ids
+    ]):
+        bookings.extend(kid_bookings)
 
-    # Get co-parent emails for looking up their sessions/camps
-    co_parent_emails = get_co_parent_emails(client, user['email'])
     all_visible_emails = {user['email']} | co_parent_emails
 
+    # Look up every booking's kid, session, camp, and week up front with
+    # batched gets, instead of several gets per booking
+    kids_by_id = {kid.key.name: kid for kid in kids}
+    sessions_by_id = get_visible_entities(
+        client, 'Session', [b['session_id'] for b in bookings], all_visible_emails
+    )
+    camps_by_id = get_visible_entities(
+        client, 'Camp', [s['camp_id'] for s in sessions_by_id.values()], all_visible_emails
+    )
+    weeks_by_id = get_visible_entities(
+        client, 'Week', [b['week_id'] for b in bookings], {user['email']}
+    )
+
     # Enrich bookings with kid, session, and week info
     enriched_bookings = []
     for booking in bookings:
         booking_dict = entity_to_dict(booking)
 
         # Get kid name
-        kid = get_kid_with_access_check(client, booking['kid_id'], user['email'])
+        kid = kids_by_id.get(booking['kid_id'])
         booking_dict['kid_name'] = kid['name'] if kid else 'Unknown'
 
         # Get session and camp name (with co-parent visibility)
-        session_entity = None
-        for email in all_visible_emails:
-            session_entity = get_entity_for_user(client, 'Session', booking['session_id'], email)
-            if session_entity:
-                break
+        session_entity = sessions_by_id.get(booking['session_id'])
 
         if session_entity:
             booking_dict['session_name'] = session_entity['name']
-            camp = None
-            for email in all_visible_emails:
-                camp = get_entity_for_user(client, 'Camp', session_entity['camp_id'], email)
-                if camp:
-                    break
+            camp = camps_by_id.get(session_entity['camp_id'])
             booking_dict['camp_name'] = camp['name'] if camp else 'Unknown'
         else:
             booking_dict['session_name'] = 'Unknown'
             booking_dict['camp_name'] = 'Unknown'
 
         # Get week info
-        week = get_entity_for_user(client, 'Week', booking['week_id'], user['email'])
+        week = weeks_by_id.get(booking['week_id'])
         if week:
             booking_dict['week_number'] = week['week_number']
             booking_dict['week_dates'] = f"{week['start_date']} - {week['end_date']}"
@@ -474,8 +504,8 @@ def booking_new():
         for w in weeks_needed:
             # Query bookings by kid_id only (not user_email) to catch all bookings from co-parents
             query = client.query(kind='Booking')
-            query.add_filter('kid_id', '=', kid_id)
-            query.add_filter('week_id', '=', w.key.name)
+            query.add_filter(filter=PropertyFilter('kid_id', '=', kid_id))
+            query.add_filter(filter=PropertyFilter('week_id', '=', w.key.name))
             existing_bookings = list(query.fetch())
 
             if existing_bookings:
@@ -529,33 +559,30 @@ def booking_new():
 
         # Parse friends attending
         friends_str = request.form.get('friends_attending', '')
-        friends = [f.strip() for f in friends_str.split(',') if f.strip()]
+        friends = parse_comma_list(friends_str)
 
         # Generate a booking group ID for multi-week sessions
         booking_group_id = str(uuid.uuid4())
 
-        # Create bookings for each week
+        # Create bookings for each week, saved together in one batch
+        new_bookings = []
         for week_num, w in enumerate(weeks_needed, start=1):
-            booking = create_entity(
-                client,
-                'Booking',
-                user['email'],
-                {
-                    'kid_id': kid_id,
-                    'session_id': session_id,
-                    'week_id': w.key.name,
-                    'state': state,
-                    'preference_order': int(request.form.get('preference_order', 0)),
-                    'friends_attending': friends,
-                    'uses_early_care': 'uses_early_care' in request.form,
-                    'uses_late_care': 'uses_late_care' in request.form,
-                    'notes': request.form.get('notes', ''),
-                    'calendar_event_id': None,
-                    'booking_group_id': booking_group_id,
-                    'week_of_session': week_num,
-                    'total_weeks': duration_weeks
-                }
-            )
+            new_bookings.append({
+                'kid_id': kid_id,
+                'session_id': session_id,
+                'week_id': w.key.name,
+                'state': state,
+                'preference_order': int(request.form.get('preference_order', 0)),
+                'friends_attending': friends,
+                'uses_early_care': 'uses_early_care' in request.form,
+                'uses_late_care': 'uses_late_care' in request.form,
+                'notes': request.form.get('notes', ''),
+                'calendar_event_id': None,
+                'booking_group_id': booking_group_id,
+                'week_of_session': week_num,
+                'total_weeks': duration_weeks
+            })
+        create_entities(client, 'Booking', user['email'], new_bookings)
 
         if duration_weeks > 1:
             flash(f"Multi-week booking created for {kid['name']} ({duration_weeks} weeks)!", 'success')
@@ -563,25 +590,31 @@ def booking_new():
             flash(f"Booking created for {kid['name']}!", 'success')
         return redirect(url_for('schedule.schedule_view'))
 
-    # GET - show form with accessible kids and camps from self + co-parents
-    kids = get_accessible_kids(client, user['email'], order_by='name')
-    weeks = query_by_user(client, 'Week', user['email'], order_by='week_number')
+    # GET - show form with accessible kids, weeks, and camps from
+    # self + co-parents. None of these reads depend on each other, so
+    # they all run at the same time.
+    visible_emails = list(all_visible_emails)
+    kids, weeks, *camps_per_email = run_concurrently(
+        [
+            (get_accessible_kids, client, user['email'], 'name'),
+            (query_by_user, client, 'Week', user['email'], 'week_number'),
+        ] + [
+            (query_by_user, client, 'Camp', email, 'name') for email in visible_emails
+        ]
+    )
 
-    # Get camps from self and co-parents
     camps = []
-    for email in all_visible_emails:
-        user_camps = query_by_user(client, 'Camp', email, order_by='name')
+    for user_camps in camps_per_email:
         camps.extend(user_camps)
 
-    # Get all sessions grouped by camp
+    # Get all sessions grouped by camp (one query per camp, at the same time)
+    sessions_per_camp = run_concurrently([
+        # Query using the camp owner's email
+        (query_by_user, client, 'Session', camp['user_email'], None, [('camp_id', '=', camp.key.name)])
+        for camp in camps
+    ])
     sessions_by_camp = {}
-    for camp in camps:
-        sessions = query_by_user(
-            client,
-            'Session',
-            camp['user_email'],  # Query using the camp owner's email
-            filters=[('camp_id', '=', camp.key.name)]
-        )
+    for camp, sessions in zip(camps, sessions_per_camp):
         sessions_by_camp[camp.key.name] = entities_to_dict_list(sessions)
 
     return render_template(
@@ -678,7 +711,7 @@ def booking_update(id):
 
     # Parse friends attending
     friends_str = request.form.get('friends_attending', '')
-    friends = [f.strip() for f in friends_str.split(',') if f.strip()]
+    friends = parse_comma_list(friends_str)
 
     # Update the booking
     update_entity(
@@ -716,7 +749,8 @@ def booking_update(id):
             parents = query_by_user(client, 'Parent', user['email'])
             parent = parents[0] if parents else {'name': user['name'], 'email': user['email']}
 
-            success = update_booking_event(
+            # Send the calendar update in the background so the page doesn't wait on Google
+            schedule_update_booking_event(
                 session['credentials'],
                 booking['calendar_event_id'],
                 entity_to_dict(parent),
@@ -726,10 +760,7 @@ def booking_update(id):
                 entity_to_dict(week)
             )
 
-            if success:
-                flash('Booking and calendar event updated successfully!', 'success')
-            else:
-                flash('Booking updated, but calendar update failed.', 'warning')
+            flash('Booking updated successfully! The calendar event is being updated in the background - check Google Calendar to confirm the change.', 'success')
         else:
             flash('Booking updated successfully!', 'success')
     else:
@@ -775,7 +806,7 @@ def booking_change_state(id):
     booking_group_id = booking.get('booking_group_id')
     if booking_group_id:
         query = client.query(kind='Booking')
-        query.add_filter('booking_group_id', '=', booking_group_id)
+        query.add_filter(filter=PropertyFilter('booking_group_id', '=', booking_group_id))
         group_bookings = list(query.fetch())
     else:
         # Single booking
@@ -788,8 +819,8 @@ def booking_change_state(id):
         for grp_booking in group_bookings:
             # Check for ANY other bookings for this kid/week (from any user)
             query = client.query(kind='Booking')
-            query.add_filter('kid_id', '=', grp_booking['kid_id'])
-            query.add_filter('week_id', '=', grp_booking['week_id'])
+            query.add_filter(filter=PropertyFilter('kid_id', '=', grp_booking['kid_id']))
+            query.add_filter(filter=PropertyFilter('week_id', '=', grp_booking['week_id']))
             all_bookings_for_week = list(query.fetch())
 
             # Check if there are other bookings (different booking group)
@@ -830,13 +861,15 @@ def booking_change_state(id):
                 flash(warning, 'warning')
             return redirect(url_for('schedule.schedule_view'))
 
-    # Update state for all bookings in the group
-    calendar_created = False
-    for grp_booking in group_bookings:
-        update_data = {'state': new_state}
+    # If transitioning to 'booked', gather the calendar event details for
+    # every week first so the events can be created in one batch request
+    calendar_bookings = []
+    if new_state == 'booked' and 'credentials' in session:
+        # Get parent for calendar (use first parent or create dummy)
+        parents = query_by_user(client, 'Parent', user['email'])
+        parent = parents[0] if parents else {'name': user['name'], 'email': user['email']}
 
-        # If transitioning to 'booked', create calendar event
-        if new_state == 'booked' and 'credentials' in session:
+        for grp_booking in group_bookings:
             # Get related entities for calendar event (with co-parent visibility)
             kid = get_kid_with_access_check(client, grp_booking['kid_id'], user['email'])
             week = get_entity_for_user(client, 'Week', grp_booking['week_id'], user['email'])
@@ -854,33 +887,53 @@ def booking_change_state(id):
                     if camp:
                         break
 
-                # Get parent for calendar (use first parent or create dummy)
-                parents = query_by_user(client, 'Parent', user['email'])
-                parent = parents[0] if parents else {'name': user['name'], 'email': user['email']}
-
-                # Create calendar event
-                calendar_event_id = create_booking_event(
-                    session['credentials'],
-                    entity_to_dict(parent),
-                    entity_to_dict(kid),
-                    entity_to_dict(camp) if camp else {'name': 'Unknown Camp'},
-                    entity_to_dict(session_entity),
-                    entity_to_dict(week)
-                )
-
-                if calendar_event_id:
-                    update_data['calendar_event_id'] = calendar_event_id
-                    calendar_created = True
-
-        update_entity(client, grp_booking, update_data)
+                calendar_bookings.append((grp_booking, {
+                    'parent': entity_to_dict(parent),
+                    'kid': entity_to_dict(kid),
+                    'camp': entity_to_dict(camp) if camp else {'name': 'Unknown Camp'},
+                    'session': entity_to_dict(session_entity),
+                    'week': entity_to_dict(week)
+                }))
+
+    # Update state for all bookings in the group. The transaction sends
+    # every update in one commit, and either all weeks change or none do.
+    with client.transaction():
+        for grp_booking in group_bookings:
+            update_entity(client, grp_booking, {'state': new_state})
+
+    # Create calendar events in the background, saving each event ID back
+    # to its booking once Google has created it
+    calendar_scheduled = False
+    if calendar_bookings:
+        booked_keys = [grp_booking.key for grp_booking, _ in calendar_bookings]
+
+        def save_calendar_event_ids(event_ids):
+            # This runs after the page has returned, so the user may have
+            # edited (or deleted) the bookings since we loaded them. Re-read
+            # them in a transaction and only set calendar_event_id, so those
+            # edits aren't overwritten with our old copy.
+            event_id_by_key = {key: event_id for key, event_id in zip(booked_keys, event_ids) if event_id}
+            if not event_id_by_key:
+                return
+            with client.transaction():
+                for current_booking in client.get_multi(list(event_id_by_key)):
+                    update_entity(client, current_booking,
+                                  {'calendar_event_id': event_id_by_key[current_booking.key]})
+
+        schedule_create_booking_events_batch(
+            session['credentials'],
+            [details for _, details in calendar_bookings],
+            on_success=save_calendar_event_ids
+        )
+        calendar_scheduled = True
 
     # Flash appropriate message
     total_weeks = booking.get('total_weeks', 1)
-    if new_state == 'booked' and calendar_created:
+    if new_state == 'booked' and calendar_scheduled:
         if total_weeks > 1:
-            flash(f"Multi-week booking state changed to '{new_state}' and added to calendar ({total_weeks} weeks)!", 'success')
+            flash(f"Multi-week booking state changed to '{new_state}' ({total_weeks} weeks). Calendar events are being created in the background - check Google Calendar to confirm they were added.", 'success')
         else:
-            flash(f"Booking state changed to '{new_state}' and added to calendar!", 'success')
+            flash(f"Booking state changed to '{new_state}'. The calendar event is being created in the background - check Google Calendar to confirm it was added.", 'success')
     elif new_state == 'booked':
         flash(f"Booking state changed to '{new_state}' but calendar event creation failed.", 'warning')
     else:
@@ -918,7 +971,7 @@ def booking_delete(id):
     if booking_group_id:
         try:
             query = client.query(kind='Booking')
-            query.add_filter('booking_group_id', '=', booking_group_id)
+            query.add_filter(filter=PropertyFilter('booking_group_id', '=', booking_group_id))
             group_bookings = list(query.fetch())
         except Exception as e:
             # If query fails, just delete the single booking
@@ -936,12 +989,9 @@ def booking_delete(id):
         try:
             # If booking was 'booked' and has a calendar event, delete it
             if grp_booking.get('state') == 'booked' and grp_booking.get('calendar_event_id') and 'credentials' in session:
-                try:
-                    success = delete_booking_event(session['credentials'], grp_booking['calendar_event_id'])
-                    if success:
-                        calendar_deleted = True
-                except Exception as e:
-                    print(f"Error deleting calendar event: {e}")
+                # Delete the calendar event in the background so the page doesn't wait on Google
+                schedule_delete_booking_event(session['credentials'], grp_booking['calendar_event_id'])
+                calendar_deleted = True
 
             delete_entity(client, grp_booking)
             bookings_deleted += 1
@@ -955,9 +1005,9 @@ def booking_delete(id):
         flash('Failed to delete booking.', 'error')
     elif calendar_deleted:
         if total_weeks > 1 or bookings_deleted > 1:
-            flash(f'Multi-week booking and calendar events deleted successfully ({bookings_deleted} weeks).', 'success')
+            flash(f'Multi-week booking deleted successfully ({bookings_deleted} weeks). Calendar events are being removed in the background - check Google Calendar to confirm they are gone.', 'success')
         else:
-            flash('Booking and calendar event deleted successfully.', 'success')
+            flash('Booking deleted successfully. The calendar event is being removed in the background - check Google Calendar to confirm it is gone.', 'success')
     else:
         if total_weeks > 1 or bookings_deleted > 1:
             flash(f'Multi-week booking deleted successfully ({bookings_deleted} weeks).', 'success')
@@ -971,6 +1021,26 @@ def booking_delete(id):
 # SCHEDULE VIEW (MAIN INTERFACE)
 # ============================================================================
 
+def query_bookings_for_kid(client, kid_id):
+    """
+    Get every booking for a kid, whichever parent created it.
+
+    Args:
+        client: datastore.Client instance
+        kid_id: ID of the kid
+
+    Returns:
+        List of Booking entities
+
+    Why: Bookings for shared kids can be made by any co-parent, so this
+    filters on kid_id instead of user_email. Callers must check the user
+    has access to the kid first.
+    """
+    query = client.query(kind='Booking')
+    query.add_filter(filter=PropertyFilter('kid_id', '=', kid_id))
+    return list(query.fetch())
+
+
 @schedule_bp.route('/')
 @login_required
 def schedule_view():
@@ -987,28 +1057,31 @@ def schedule_view():
     # Get view preference from cookie (default to horizontal)
     view_mode = request.cookies.get('schedule_view', 'horizontal')
 
-    # Get all accessible kids (owned + shared)
-    kids = get_accessible_kids(client, user['email'], order_by='name')
-    weeks = query_by_user(client, 'Week', user['email'], order_by='week_number')
+    # These reads don't depend on each other, so run them at the same time:
+    # all accessible kids (owned + shared), weeks, trips, and co-parent
+    # emails (for looking up their sessions/camps)
+    kids, weeks, trips, co_parent_emails = run_concurrently([
+        (get_accessible_kids, client, user['email'], 'name'),
+        (query_by_user, client, 'Week', user['email'], 'week_number'),
+        (query_by_user, client, 'Trip', user['email']),
+        (get_co_parent_emails, client, user['email']),
+    ])
 
     # Auto-calculate weeks if user has accessible kids but no weeks yet
     # This handles co-parents who haven't calculated weeks themselves
     if kids and not weeks:
         weeks = calculate_weeks_for_user(client, user['email'])
 
-    trips = list(query_by_user(client, 'Trip', user['email']))
-
     # Get bookings for all accessible kids (from any user who has access)
-    # This includes bookings created by co-parents for shared kids
+    # This includes bookings created by co-parents for shared kids.
+    # One query per kid, all running at the same time.
     accessible_kid_ids = [k.key.name for k in kids]
     bookings = []
-    for kid_id in accessible_kid_ids:
-        query = client.query(kind='Booking')
-        query.add_filter('kid_id', '=', kid_id)
-        bookings.extend(list(query.fetch()))
+    for kid_bookings in run_concurrently([
+        (query_bookings_for_kid, client, kid_id) for kid_id in accessible_kid_ids
+    ]):
+        bookings.extend(kid_bookings)
 
-    # Get co-parent emails for looking up their sessions/camps
-    co_parent_emails = get_co_parent_emails(client, user['email'])
     all_visible_emails = {user['email']} | co_parent_emails
 
     # Build a lookup of current user's weeks by date range for matching
@@ -1019,14 +1092,26 @@ def schedule_view():
         week_start = week['start_date']
         week_by_dates[week_start] = week.key.name
 
+    # Look up every booking's original week, session, and camp up front
+    # with batched gets, instead of several gets per booking.
+    # Weeks may belong to a co-parent, so they aren't filtered by owner
+    # (the bookings themselves come from kids this user can access).
+    week_keys = [client.key('Week', week_id) for week_id in {b['week_id'] for b in bookings}]
+    original_weeks_by_id = {week.key.name: week for week in client.get_multi(week_keys)}
+    sessions_by_id = get_visible_entities(
+        client, 'Session', [b['session_id'] for b in bookings], all_visible_emails
+    )
+    camps_by_id = get_visible_entities(
+        client, 'Camp', [s['camp_id'] for s in sessions_by_id.values()], all_visible_emails
+    )
+
     # Build a lookup: (kid_id, week_id) -> [bookings]
     # We map booking week_ids to current user's week_ids by looking up the original week's dates
     bookings_lookup = {}
     for booking in bookings:
         # Get the original week to find its dates
         original_week_id = booking['week_id']
-        original_week_key = client.key('Week', original_week_id)
-        original_week = client.get(original_week_key)
+        original_week = original_weeks_by_id.get(original_week_id)
 
         # Find matching week in current user's weeks by start date
         matched_week_id = original_week_id  # Default to original
@@ -1042,19 +1127,11 @@ def schedule_view():
         # Enrich booking with session/camp info
         # Try looking up the session from visible users (self + co-parents)
         booking_dict = entity_to_dict(booking)
-        session_entity = None
-        for email in all_visible_emails:
-            session_entity = get_entity_for_user(client, 'Session', booking['session_id'], email)
-            if session_entity:
-                break
+        session_entity = sessions_by_id.get(booking['session_id'])
 
         if session_entity:
             booking_dict['session_name'] = session_entity['name']
-            camp = None
-            for email in all_visible_emails:
-                camp = get_entity_for_user(client, 'Camp', session_entity['camp_id'], email)
-                if camp:
-                    break
+            camp = camps_by_id.get(session_entity['camp_id'])
             booking_dict['camp_name'] = camp['name'] if camp else 'Unknown'
         else:
             booking_dict['session_name'] = 'Unknown'
@@ -1069,10 +1146,8 @@ def schedule_view():
             week_start = week['start_date']
             week_end = week['end_date']
             for trip in trips:
-                trip_start = trip['start_date']
-                trip_end = trip['end_date']
                 # Check if trip overlaps with this week
-                if trip_start <= week_end and trip_end >= week_start:
+                if trip_overlaps_week(trip, week_start, week_end):
                     week_trips[week.key.name] = trip['name']
                     break
 
@@ -1281,8 +1356,8 @@ def api_quick_booking():
     # Check for booking collisions with booked camps (from any user who has access to this kid)
     for w in weeks_needed:
         query = client.query(kind='Booking')
-        query.add_filter('kid_id', '=', kid_id)
-        query.add_filter('week_id', '=', w.key.name)
+        query.add_filter(filter=PropertyFilter('kid_id', '=', kid_id))
+        query.add_filter(filter=PropertyFilter('week_id', '=', w.key.name))
         existing_bookings = list(query.fetch())
 
         for existing in existing_bookings:
@@ -1482,9 +1557,7 @@ def view_shared_schedule(token):
             week_start = week['start_date']
             week_end = week['end_date']
             for trip in trips:
-                trip_start = trip['start_date']
-                trip_end = trip['end_date']
-                if trip_start <= week_end and trip_end >= week_start:
+                if trip_overlaps_week(trip, week_start, week_end):
                     week_trips[week.key.name] = trip['name']
                     break
 
@@ -54,7 +54,15 @@ async function parseUrl() {
             body: JSON.stringify({ url: url })
         });
 
-        const result = await response.json();
+        const started = await response.json();
+
+        if (!started.success) {
+            showStatus('Error: ' + started.error, 'error');
+            return;
+        }
+
+        // Parsing runs in the background on the server; wait for it to finish
+        const result = await waitForParseJob(started.job_id);
 
         if (!result.success) {
             showStatus('Error: ' + result.error, 'error');
@@ -105,6 +113,32 @@ async function parseUrl() {
     }
 }
 
+// How often to check on a parse job, and when to give up waiting
+const PARSE_POLL_INTERVAL_MS = 2000;
+const PARSE_TIMEOUT_MS = 3 * 60 * 1000;
+
+/**
+ * Poll the server until a URL parse job finishes.
+ *
+ * Returns the parse result ({success, data, ...}) once the job is done.
+ */
+async function waitForParseJob(jobId) {
+    const deadline = Date.now() + PARSE_TIMEOUT_MS;
+
+    while (Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, PARSE_POLL_INTERVAL_MS));
+
+        const response = await fetch(`/camps/parse-url/${jobId}`);
+        const result = await response.json();
+
+        if (result.status !== 'pending') {
+            return result;
+        }
+    }
+
+    return { success: false, error: 'Parsing is taking too long. Please try again.' };
+}
+
 /**
  * Show session selector UI for choosing which sessions to add.
  */
@@ -0,0 +1,11 @@
+"""
+Shared pytest setup.
+
+Lets the tests import the app's modules (camps, schedule, ...) directly,
+since they live in the repository root rather than in a package.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
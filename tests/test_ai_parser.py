@@ -0,0 +1,128 @@
+"""
+Tests for the HTML and JSON helpers in ai_parser.py.
+
+None of these call Gemini or fetch pages.
+
+Run with: python3 -m pytest tests/test_ai_parser.py -v
+"""
+
+from unittest import mock
+
+import ai_parser
+from ai_parser import (
+    JsonObjectScanner,
+    get_model,
+    identify_relevant_links,
+    parse_complete_json_object,
+    truncate_html,
+)
+
+
+class TestTruncateHtml:
+    """truncate_html cuts long HTML at a closing tag where it can."""
+
+    def test_short_html_is_unchanged(self):
+        html = '<p>Week 1</p>'
+        assert truncate_html(html, 100) == html
+
+    def test_cuts_after_last_complete_row(self):
+        html = '<table><tr><td>Week 1</td></tr><tr><td>Week 2</td></tr></table>'
+        max_chars = html.index('Week 2')
+
+        assert truncate_html(html, max_chars) == '<table><tr><td>Week 1</td></tr>'
+
+    def test_plain_cut_when_no_tag_near_the_end(self):
+        html = '<p>Hi</p>' + 'x' * 100
+
+        assert truncate_html(html, 50) == html[:50]
+
+
+class TestParseCompleteJsonObject:
+    """parse_complete_json_object finds the first finished JSON object."""
+
+    def test_object_with_text_around_it(self):
+        text = 'Here you go: {"camp": {"name": "Art"}} Hope that helps!'
+        assert parse_complete_json_object(text) == {'camp': {'name': 'Art'}}
+
+    def test_incomplete_object(self):
+        assert parse_complete_json_object('{"camp": {"name": "Art"}') is None
+
+    def test_braces_inside_strings_are_ignored(self):
+        text = '{"note": "use {curly} and \\"quoted\\" text"}'
+        assert parse_complete_json_object(text) == {'note': 'use {curly} and "quoted" text'}
+
+    def test_invalid_json(self):
+        assert parse_complete_json_object('{"camp": "Art",}') is None
+
+    def test_no_object(self):
+        assert parse_complete_json_object('No JSON here') is None
+
+
+class TestJsonObjectScanner:
+    """JsonObjectScanner finds the object across streamed chunks."""
+
+    def test_object_split_across_chunks(self):
+        scanner = JsonObjectScanner()
+        chunks = ['```json\n{"sessions": [{"name": "We', 'ek {1}\\"', '"}', ']}', '\n```']
+
+        results = [scanner.feed(chunk) for chunk in chunks]
+
+        assert results == [None, None, None, {'sessions': [{'name': 'Week {1}"'}]}, None]
+
+    def test_nothing_after_the_first_object(self):
+        scanner = JsonObjectScanner()
+
+        assert scanner.feed('{"a": 1,}') is None
+        assert scanner.feed(' {"b": 2}') is None
+
+
+class TestIdentifyRelevantLinks:
+    """identify_relevant_links keeps same-site links about sessions."""
+
+    def test_keeps_relevant_same_site_links(self):
+        html = '''
+            <a href="/summer-sessions">Summer Sessions</a>
+            <a href="/about">Pricing</a>
+            <a href="/contact">Contact us</a>
+            <a href="https://other.example.com/sessions">Sessions elsewhere</a>
+            <a href="/summer-sessions">Sessions again</a>
+        '''
+
+        links = identify_relevant_links(html, 'https://camp.example.com/')
+
+        assert links == [
+            'https://camp.example.com/summer-sessions',
+            'https://camp.example.com/about',
+        ]
+
+    def test_page_with_xml_declaration(self):
+        html = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<html><body><a href="/schedule">Schedule</a></body></html>'
+        )
+
+        links = identify_relevant_links(html, 'https://camp.example.com/')
+
+        assert links == ['https://camp.example.com/schedule']
+
+    def test_empty_page(self):
+        assert identify_relevant_links('', 'https://camp.example.com/') == []
+
+
+class TestGetModel:
+    """get_model shares one model per project, region and model name."""
+
+    def test_models_are_per_project(self):
+        with mock.patch.dict(ai_parser._models, clear=True), \
+                mock.patch.object(ai_parser.vertexai, 'init') as init, \
+                mock.patch.object(ai_parser, 'GenerativeModel', side_effect=lambda name: object()):
+            first = get_model('project-a', 'us-central1', 'test-model')
+            other_project = get_model('project-b', 'us-central1', 'test-model')
+            again = get_model('project-a', 'us-central1', 'test-model')
+
+        assert again is first
+        assert other_project is not first
+        assert init.call_args_list == [
+            mock.call(project='project-a', location='us-central1'),
+            mock.call(project='project-b', location='us-central1'),
+        ]
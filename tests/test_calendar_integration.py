@@ -0,0 +1,49 @@
+"""
+Tests for building Google Calendar event text in calendar_integration.py.
+
+Run with: python3 -m pytest tests/test_calendar_integration.py -v
+"""
+
+from calendar_integration import format_booking_description
+
+
+class TestFormatBookingDescription:
+    """format_booking_description lists the booking's details, one per line."""
+
+    def test_all_details(self):
+        kid = {'name': 'Ava'}
+        camp = {'name': 'Art Camp', 'phone': '555-0100', 'website': 'https://art.example.com'}
+        session = {
+            'name': 'Week 1',
+            'start_time': '9:00 AM',
+            'end_time': '3:00 PM',
+            'dropoff_window_start': '8:30 AM',
+            'dropoff_window_end': '9:00 AM',
+            'pickup_window_start': '3:00 PM',
+            'pickup_window_end': '3:30 PM',
+            'cost': 350,
+            'url': 'https://art.example.com/week-1',
+        }
+
+        assert format_booking_description(kid, camp, session).split('\n') == [
+            'Camp: Art Camp',
+            'Session: Week 1',
+            'Kid: Ava',
+            'Time: 9:00 AM - 3:00 PM',
+            'Drop-off: 8:30 AM - 9:00 AM',
+            'Pick-up: 3:00 PM - 3:30 PM',
+            'Cost: $350.00',
+            'Phone: 555-0100',
+            'Website: https://art.example.com',
+            'Session Info: https://art.example.com/week-1',
+        ]
+
+    def test_missing_details_are_left_out(self):
+        kid = {'name': 'Ava'}
+        camp = {'name': 'Art Camp', 'phone': '', 'website': None}
+        # Only a start time, so there's no time range to show
+        session = {'name': 'Week 1', 'start_time': '9:00 AM', 'cost': None}
+
+        assert format_booking_description(kid, camp, session) == (
+            'Camp: Art Camp\nSession: Week 1\nKid: Ava'
+        )
@@ -0,0 +1,164 @@
+"""
+Tests for the Datastore helper functions in datastore_helpers.py.
+
+The Datastore client is replaced with mocks, so no Google Cloud project is
+needed.
+
+Run with: python3 -m pytest tests/test_datastore_helpers.py -v
+"""
+
+from datetime import datetime, timezone
+from unittest import mock
+
+from google.api_core.exceptions import InvalidArgument
+from google.cloud import datastore
+import pytest
+
+import datastore_helpers
+
+
+def make_page_client(*fetch_results):
+    """
+    Mock client whose query().fetch() returns (or raises) each result in turn.
+
+    Each result is an exception or a (entities, next_page_token) pair.
+    """
+    fetch_side_effects = []
+    for result in fetch_results:
+        if isinstance(result, Exception):
+            fetch_side_effects.append(result)
+        else:
+            entities, token = result
+            iterator = mock.MagicMock()
+            iterator.__iter__.return_value = iter(entities)
+            iterator.next_page_token = token
+            fetch_side_effects.append(iterator)
+
+    client = mock.Mock()
+    client.query.return_value.fetch.side_effect = fetch_side_effects
+    return client
+
+
+class TestQueryPageByUser:
+    """query_page_by_user returns one page plus the next cursor."""
+
+    def test_full_page_returns_next_cursor(self):
+        client = make_page_client((['a', 'b'], b'next-page'))
+
+        entities, next_cursor = datastore_helpers.query_page_by_user(
+            client, 'Trip', 'parent@example.com', page_size=2
+        )
+
+        assert entities == ['a', 'b']
+        assert next_cursor == 'next-page'
+
+    def test_short_page_is_the_last(self):
+        client = make_page_client((['a'], b'next-page'))
+
+        entities, next_cursor = datastore_helpers.query_page_by_user(
+            client, 'Trip', 'parent@example.com', page_size=2
+        )
+
+        assert entities == ['a']
+        assert next_cursor is None
+
+    @pytest.mark.parametrize('error', [
+        ValueError('Incorrect padding'),
+        InvalidArgument('Invalid cursor'),
+    ])
+    def test_invalid_cursor_falls_back_to_first_page(self, error):
+        client = make_page_client(error, (['a'], None))
+
+        entities, next_cursor = datastore_helpers.query_page_by_user(
+            client, 'Trip', 'parent@example.com', page_size=2, cursor='garbled'
+        )
+
+        assert entities == ['a']
+        assert next_cursor is None
+        retry_kwargs = client.query.return_value.fetch.call_args.kwargs
+        assert 'start_cursor' not in retry_kwargs
+
+    def test_errors_without_a_cursor_are_raised(self):
+        client = make_page_client(InvalidArgument('Bad query'))
+
+        with pytest.raises(InvalidArgument):
+            datastore_helpers.query_page_by_user(client, 'Trip', 'parent@example.com')
+
+
+def make_session():
+    """A Session entity as Datastore returns it."""
+    session = datastore.Entity(key=datastore.Key('Session', 'session-1', project='test-project'))
+    session.update({
+        'name': 'Week 1',
+        'url': 'https://camp.example.com/week-1',
+        'registration_open_date': datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc),
+        'session_start_date': datetime(2026, 6, 15, tzinfo=timezone.utc),
+    })
+    return session
+
+
+class TestEntityView:
+    """EntityView reads like entity_to_dict but converts values lazily."""
+
+    def test_matches_entity_to_dict(self):
+        session = make_session()
+
+        assert dict(datastore_helpers.EntityView(session)) == datastore_helpers.entity_to_dict(session)
+
+    def test_formats_datetimes(self):
+        view = datastore_helpers.EntityView(make_session())
+
+        assert view['id'] == 'session-1'
+        assert view['session_start_date'] == '2026-06-15'
+        assert view['registration_open_date'] == '2026-03-01T09:30:00+00:00'
+
+    def test_missing_property_raises_key_error(self):
+        view = datastore_helpers.EntityView(make_session())
+
+        assert view.get('cost') is None
+        with pytest.raises(KeyError):
+            view['cost']
+
+    def test_setting_and_deleting_leaves_the_entity_alone(self):
+        session = make_session()
+        view = datastore_helpers.EntityView(session)
+
+        view['is_owner'] = True
+        view['name'] = 'Renamed'
+        del view['url']
+
+        assert view['is_owner'] is True
+        assert view['name'] == 'Renamed'
+        assert 'url' not in view
+        assert set(view) == {'name', 'registration_open_date', 'session_start_date', 'id', 'is_owner'}
+        assert len(view) == 5
+        assert session['name'] == 'Week 1'
+        assert session['url'] == 'https://camp.example.com/week-1'
+        assert 'is_owner' not in session
+
+
+class TestUpdateEntity:
+    """update_entity only writes when a property really changes."""
+
+    def test_unchanged_form_dates_are_not_saved(self):
+        client = mock.Mock()
+        session = make_session()
+
+        # Form parsers return naive datetimes for the stored UTC dates
+        datastore_helpers.update_entity(client, session, {
+            'name': 'Week 1',
+            'session_start_date': datetime(2026, 6, 15),
+            'registration_open_date': datetime(2026, 3, 1, 9, 30),
+        })
+
+        client.put.assert_not_called()
+        assert 'updated_at' not in session
+
+    def test_changed_date_is_saved(self):
+        client = mock.Mock()
+        session = make_session()
+
+        datastore_helpers.update_entity(client, session, {'session_start_date': datetime(2026, 6, 22)})
+
+        client.put.assert_called_once_with(session)
+        assert session['session_start_date'] == datetime(2026, 6, 22)
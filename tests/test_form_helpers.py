@@ -0,0 +1,105 @@
+"""
+Tests for the form parsing helpers in form_helpers.py.
+
+Run with: python3 -m pytest tests/test_form_helpers.py -v
+"""
+
+from datetime import datetime
+
+import pytest
+from werkzeug.datastructures import ImmutableMultiDict
+
+from form_helpers import (
+    parse_comma_list,
+    parse_form_date,
+    parse_form_datetime,
+    parse_optional_date,
+    parse_session_form,
+)
+
+
+class TestParseFormDate:
+    """parse_form_date turns 'YYYY-MM-DD' into a midnight datetime."""
+
+    def test_valid_date(self):
+        assert parse_form_date('2026-06-15') == datetime(2026, 6, 15)
+
+    def test_invalid_date_raises(self):
+        with pytest.raises(ValueError):
+            parse_form_date('2026-02-30')
+
+    def test_optional_date_ignores_missing_and_invalid(self):
+        assert parse_optional_date('') is None
+        assert parse_optional_date(None) is None
+        assert parse_optional_date('June 15th') is None
+        assert parse_optional_date('2026-06-15') == datetime(2026, 6, 15)
+
+    def test_datetime_with_time(self):
+        assert parse_form_datetime('2026-03-01 09:30') == datetime(2026, 3, 1, 9, 30)
+
+
+class TestParseCommaList:
+    """parse_comma_list trims names and drops blanks."""
+
+    def test_trims_and_drops_blanks(self):
+        assert parse_comma_list('Ava, Ben,, Cal ') == ['Ava', 'Ben', 'Cal']
+
+    def test_empty_text(self):
+        assert parse_comma_list('') == []
+        assert parse_comma_list(' , ') == []
+
+
+class TestParseSessionForm:
+    """parse_session_form turns the session form into entity properties."""
+
+    def test_filled_in_form(self):
+        form = ImmutableMultiDict({
+            'name': 'Week 1',
+            'age_min': '6',
+            'age_max': '9',
+            'duration_weeks': '2',
+            'session_start_date': '2026-06-15',
+            'session_end_date': '2026-06-26',
+            'start_time': '09:00',
+            'cost': '350.50',
+            'early_care_available': 'on',
+            'registration_open_date': '2026-03-01',
+            'registration_open_time': '09:00',
+        })
+
+        properties = parse_session_form(form)
+
+        assert properties['name'] == 'Week 1'
+        assert properties['age_min'] == 6
+        assert properties['age_max'] == 9
+        assert properties['duration_weeks'] == 2
+        assert properties['session_start_date'] == datetime(2026, 6, 15)
+        assert properties['session_end_date'] == datetime(2026, 6, 26)
+        assert properties['start_time'] == '09:00'
+        assert properties['cost'] == 350.5
+        assert properties['early_care_available'] is True
+        assert properties['late_care_available'] is False
+        assert properties['registration_open_date'] == datetime(2026, 3, 1, 9, 0)
+
+    def test_blank_fields_use_defaults(self):
+        form = ImmutableMultiDict({'name': 'Week 1', 'age_min': '', 'url': ''})
+
+        properties = parse_session_form(form)
+
+        assert properties['age_min'] is None
+        assert properties['duration_weeks'] == 1
+        assert properties['session_start_date'] is None
+        assert properties['url'] == ''
+        assert properties['cost'] is None
+        assert properties['early_care_available'] is False
+
+    def test_registration_date_needs_a_time(self):
+        form = ImmutableMultiDict({'name': 'Week 1', 'registration_open_date': '2026-03-01'})
+
+        assert parse_session_form(form)['registration_open_date'] is None
+
+    def test_invalid_number_raises(self):
+        form = ImmutableMultiDict({'name': 'Week 1', 'age_min': 'six'})
+
+        with pytest.raises(ValueError):
+            parse_session_form(form)
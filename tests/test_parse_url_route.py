@@ -0,0 +1,203 @@
+"""
+Tests for the AI URL parsing routes in camps.py.
+
+These run the real Flask routes against a small in-memory stand-in for the
+Datastore client, so no Google Cloud project is needed.
+
+Run with: python3 -m pytest tests/test_parse_url_route.py -v
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from flask import Flask
+from google.cloud import datastore
+
+import camps
+
+
+class FakeDatastoreClient:
+    """Just enough of datastore.Client for the parse-url routes."""
+
+    def __init__(self):
+        self.saved = {}
+
+    def key(self, kind, name):
+        return datastore.Key(kind, name, project='test-project')
+
+    def put(self, entity):
+        self.saved[entity.key] = entity
+
+    def get(self, key):
+        return self.saved.get(key)
+
+    def delete(self, key):
+        self.saved.pop(key, None)
+
+    def delete_multi(self, keys):
+        for key in keys:
+            self.delete(key)
+
+
+def make_app():
+    """Build a minimal app with only the camps blueprint registered."""
+    app = Flask(__name__)
+    app.secret_key = 'test-secret'
+    app.config.update(
+        TESTING=True,
+        GCP_PROJECT_ID='test-project',
+        GCP_REGION='us-central1',
+        GEMINI_MODEL='test-model'
+    )
+    app.register_blueprint(camps.camps_bp)
+    return app
+
+
+def make_job(fake_client, state='pending', age=timedelta(seconds=10), result=None):
+    """Save a ParseJob for the signed-in user, created `age` ago."""
+    job = datastore.Entity(key=fake_client.key('ParseJob', 'job-1'))
+    job.update({
+        'user_email': 'parent@example.com',
+        'url': 'https://camp.example.com/sessions',
+        'state': state,
+        'result': result,
+        'created_at': datetime.now(timezone.utc) - age
+    })
+    fake_client.put(job)
+    return job
+
+
+def logged_in_client(app):
+    """Test client with a signed-in user in the session."""
+    test_client = app.test_client()
+    with test_client.session_transaction() as flask_session:
+        flask_session['user'] = {'email': 'parent@example.com', 'name': 'Parent'}
+    return test_client
+
+
+class TestParseUrlRoute:
+    """POST /camps/parse-url starts a background job."""
+
+    def test_creates_pending_job_and_submits_it(self):
+        fake_client = FakeDatastoreClient()
+        app = make_app()
+
+        with mock.patch.object(camps, 'get_datastore_client', return_value=fake_client), \
+                mock.patch.object(camps, 'query_by_user', return_value=[]), \
+                mock.patch.object(camps, 'parse_executor') as executor:
+            response = logged_in_client(app).post(
+                '/camps/parse-url',
+                json={'url': 'https://camp.example.com/sessions'}
+            )
+
+        assert response.status_code == 202
+        body = response.get_json()
+        assert body['success'] is True
+
+        job = fake_client.get(fake_client.key('ParseJob', body['job_id']))
+        assert job['state'] == 'pending'
+        assert job['url'] == 'https://camp.example.com/sessions'
+        assert job['user_email'] == 'parent@example.com'
+        assert 'result' in job.exclude_from_indexes
+
+        executor.submit.assert_called_once()
+        submitted_args = executor.submit.call_args.args
+        assert submitted_args[0] is camps.run_parse_job
+        assert submitted_args[1] == body['job_id']
+
+    def test_missing_url_is_rejected(self):
+        app = make_app()
+
+        with mock.patch.object(camps, 'get_datastore_client', return_value=FakeDatastoreClient()), \
+                mock.patch.object(camps, 'parse_executor') as executor:
+            response = logged_in_client(app).post('/camps/parse-url', json={})
+
+        assert response.status_code == 400
+        executor.submit.assert_not_called()
+
+    def test_deletes_abandoned_jobs(self):
+        fake_client = FakeDatastoreClient()
+        abandoned = make_job(fake_client, age=timedelta(hours=2))
+        app = make_app()
+
+        with mock.patch.object(camps, 'get_datastore_client', return_value=fake_client), \
+                mock.patch.object(camps, 'query_by_user', return_value=[abandoned]) as query, \
+                mock.patch.object(camps, 'parse_executor'):
+            response = logged_in_client(app).post(
+                '/camps/parse-url',
+                json={'url': 'https://camp.example.com/sessions'}
+            )
+
+        assert response.status_code == 202
+        assert fake_client.get(abandoned.key) is None
+        # Only jobs older than the timeout are looked up
+        (prop, operator, cutoff), = query.call_args.kwargs['filters']
+        assert (prop, operator) == ('created_at', '<')
+        assert cutoff <= datetime.now(timezone.utc) - camps.PARSE_JOB_TIMEOUT
+
+
+class TestParseUrlStatusRoute:
+    """GET /camps/parse-url/<job_id> reports on a background job."""
+
+    def get_status(self, fake_client):
+        app = make_app()
+        with mock.patch.object(camps, 'get_datastore_client', return_value=fake_client):
+            return logged_in_client(app).get('/camps/parse-url/job-1')
+
+    def test_recent_pending_job_is_still_pending(self):
+        fake_client = FakeDatastoreClient()
+        job = make_job(fake_client)
+
+        response = self.get_status(fake_client)
+
+        assert response.get_json() == {'success': True, 'status': 'pending'}
+        assert fake_client.get(job.key) is job
+
+    def test_stale_pending_job_is_reported_and_deleted(self):
+        fake_client = FakeDatastoreClient()
+        job = make_job(fake_client, age=camps.PARSE_JOB_TIMEOUT + timedelta(minutes=1))
+
+        response = self.get_status(fake_client)
+
+        body = response.get_json()
+        assert body['success'] is False
+        assert body['status'] == 'error'
+        assert fake_client.get(job.key) is None
+
+    def test_finished_job_returns_result_and_is_deleted(self):
+        fake_client = FakeDatastoreClient()
+        job = make_job(fake_client, state='done', result='{"success": true, "data": {}}')
+
+        response = self.get_status(fake_client)
+
+        assert response.get_json() == {'success': True, 'data': {}, 'status': 'done'}
+        assert fake_client.get(job.key) is None
+
+
+class TestRunParseJob:
+    """run_parse_job saves the result on the job, even when things go wrong."""
+
+    def run_job(self, fake_client, parse_result):
+        with mock.patch.object(camps, 'get_datastore_client', return_value=fake_client), \
+                mock.patch.object(camps, 'parse_session_url', return_value=parse_result):
+            camps.run_parse_job('job-1', 'https://camp.example.com/sessions',
+                                'test-project', 'us-central1', 'test-model')
+
+    def test_saves_result(self):
+        fake_client = FakeDatastoreClient()
+        job = make_job(fake_client)
+
+        self.run_job(fake_client, {'success': True, 'data': {}})
+
+        assert job['state'] == 'done'
+        assert job['result'] == '{"success":true,"data":{}}'
+
+    def test_save_failure_marks_job_as_error(self):
+        fake_client = FakeDatastoreClient()
+        job = make_job(fake_client)
+
+        # orjson can't serialize a set, so saving the result fails
+        self.run_job(fake_client, {'success': True, 'data': {'tags': {'art'}}})
+
+        assert job['state'] == 'error'
+        assert '"success":false' in job['result']
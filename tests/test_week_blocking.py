@@ -0,0 +1,85 @@
+"""
+Tests for trip-based week blocking in schedule.py.
+
+Trips saved from a form have naive datetimes, while weeks read back from
+Datastore have timezone-aware (UTC) ones. These tests make sure the two
+can be compared.
+
+Run with: python3 -m pytest tests/test_week_blocking.py -v
+"""
+
+from datetime import datetime, timezone
+from unittest import mock
+
+from google.cloud import datastore
+
+import schedule
+
+
+def make_week(week_id, start_day, end_day, is_blocked=False):
+    """A Week entity as Datastore returns it (UTC-aware dates)."""
+    week = datastore.Entity(key=datastore.Key('Week', week_id, project='test-project'))
+    week.update({
+        'start_date': datetime(2026, 6, start_day, tzinfo=timezone.utc),
+        'end_date': datetime(2026, 6, end_day, tzinfo=timezone.utc),
+        'is_blocked': is_blocked
+    })
+    return week
+
+
+def make_form_trip(start_day, end_day):
+    """A trip as trip_new builds it from the form (naive dates)."""
+    return {
+        'name': 'Beach',
+        'start_date': datetime(2026, 6, start_day),
+        'end_date': datetime(2026, 6, end_day)
+    }
+
+
+class TestTripOverlapsWeek:
+    """Overlap check works for any mix of naive and aware datetimes."""
+
+    def test_naive_trip_inside_aware_week(self):
+        week = make_week('w1', 15, 19)
+        assert schedule.trip_overlaps_week(make_form_trip(16, 17), week['start_date'], week['end_date'])
+
+    def test_naive_trip_before_aware_week(self):
+        week = make_week('w1', 15, 19)
+        assert not schedule.trip_overlaps_week(make_form_trip(8, 12), week['start_date'], week['end_date'])
+
+    def test_trip_ending_on_monday_overlaps(self):
+        week = make_week('w1', 15, 19)
+        assert schedule.trip_overlaps_week(make_form_trip(10, 15), week['start_date'], week['end_date'])
+
+
+class TestUpdateWeekBlocking:
+    """update_week_blocking with an unsaved (naive) trip and stored (aware) weeks."""
+
+    def test_blocks_only_overlapping_weeks(self):
+        weeks = [make_week('w1', 15, 19), make_week('w2', 22, 26, is_blocked=True)]
+        updates = {}
+
+        def record_update(client, entity, properties):
+            updates[entity.key.name] = properties
+
+        with mock.patch.object(schedule, 'query_by_user', return_value=weeks), \
+                mock.patch.object(schedule, 'update_entity', side_effect=record_update):
+            schedule.update_week_blocking(
+                client=None,
+                user_email='parent@example.com',
+                trips=[make_form_trip(16, 17)]
+            )
+
+        assert updates == {
+            'w1': {'is_blocked': True},
+            'w2': {'is_blocked': False}
+        }
+
+    def test_unchanged_weeks_are_not_written(self):
+        weeks = [make_week('w1', 15, 19, is_blocked=True)]
+
+        with mock.patch.object(schedule, 'query_by_user', return_value=weeks), \
+                mock.patch.object(schedule, 'update_entity') as update:
+            schedule.update_week_blocking(None, 'parent@example.com', trips=[make_form_trip(15, 15)])
+
+        update.assert_not_called()